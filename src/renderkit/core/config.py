@@ -41,6 +41,7 @@ class ContactSheetConfig:
     font_size: int = 16
     layer_width: Optional[int] = None
     layer_height: Optional[int] = None
+    layer_workers: int = 1  # Threads reading/scaling layers (1 = serial)
 
     def __post_init__(self) -> None:
         """Validate configuration."""
@@ -54,6 +55,8 @@ class ContactSheetConfig:
             raise ConfigurationError("Layer width must be greater than 0")
         if self.layer_height is not None and self.layer_height <= 0:
             raise ConfigurationError("Layer height must be greater than 0")
+        if self.layer_workers <= 0:
+            raise ConfigurationError("Layer workers must be greater than 0")
 
     def resolve_layer_size(self, source_width: int, source_height: int) -> tuple[int, int]:
         """Resolve target layer size based on config or source resolution."""
@@ -88,6 +91,7 @@ class ContactSheetConfigBuilder:
         self._font_size: int = 16
         self._layer_width: Optional[int] = None
         self._layer_height: Optional[int] = None
+        self._layer_workers: int = 1
 
     def with_columns(self, columns: int) -> "ContactSheetConfigBuilder":
         """Set number of columns."""
@@ -118,6 +122,11 @@ class ContactSheetConfigBuilder:
         self._font_size = font_size
         return self
 
+    def with_layer_workers(self, workers: int) -> "ContactSheetConfigBuilder":
+        """Set number of threads used to read and scale layers."""
+        self._layer_workers = workers
+        return self
+
     def build(self) -> ContactSheetConfig:
         """Build ContactSheetConfig."""
         return ContactSheetConfig(
@@ -129,6 +138,7 @@ class ContactSheetConfigBuilder:
             font_size=self._font_size,
             layer_width=self._layer_width,
             layer_height=self._layer_height,
+            layer_workers=self._layer_workers,
         )
 
 
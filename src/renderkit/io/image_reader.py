@@ -17,6 +17,11 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_PART_NAMES = {"rgba", "beauty", "default"}
 
+# Cache: (path, mtime, layer) -> subimage index. Shared across readers because the
+# factory hands out a fresh reader per request (e.g. every preview frame).
+_SUBIMAGE_INDEX_CACHE: dict[tuple[str, float, str], int] = {}
+_SUBIMAGE_INDEX_CACHE_SIZE = 512
+
 
 def _normalize_part_name(part_name: Any) -> Optional[str]:
     if part_name is None:
@@ -423,16 +428,35 @@ class OIIOReader(ImageReader):
         return subimage_index, channel_indices, use_layer_map
 
     def _scan_subimage_index(self, path: Path, layer: str, oiio) -> int:
-        temp_buf = oiio.ImageBuf(str(path))
-        for i in range(temp_buf.nsubimages):
-            sub_buf = oiio.ImageBuf(str(path), i, 0)
-            spec = sub_buf.spec()
-            part_name = _normalize_part_name(spec.getattribute("name"))
-            if part_name and part_name == layer:
-                return i
+        cache_key = (*self._get_cache_key(path), layer)
+        cached = _SUBIMAGE_INDEX_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
-            if any(c.startswith(f"{layer}.") for c in spec.channelnames):
-                return i
+        subimage_index = self._find_subimage_index(path, layer, oiio)
+        if len(_SUBIMAGE_INDEX_CACHE) >= _SUBIMAGE_INDEX_CACHE_SIZE:
+            _SUBIMAGE_INDEX_CACHE.clear()
+        _SUBIMAGE_INDEX_CACHE[cache_key] = subimage_index
+        return subimage_index
+
+    def _find_subimage_index(self, path: Path, layer: str, oiio) -> int:
+        # One ImageInput reads every part header; no pixels are decoded here
+        inp = oiio.ImageInput.open(str(path))
+        if inp is None:
+            return 0
+        try:
+            i = 0
+            while inp.seek_subimage(i, 0):
+                spec = inp.spec()
+                part_name = _normalize_part_name(spec.getattribute("name"))
+                if part_name and part_name == layer:
+                    return i
+
+                if any(c.startswith(f"{layer}.") for c in spec.channelnames):
+                    return i
+                i += 1
+        finally:
+            inp.close()
 
         return 0
 
@@ -35,23 +35,105 @@ class BurnInProcessor:
         if not burnin_config or not burnin_config.elements:
             return buf
 
-        spec = buf.spec()
-        width = spec.width
+        width = buf.spec().width
+        bar_height = self._bar_height(burnin_config)
 
         # Draw background bar if requested
-        if getattr(burnin_config, "use_background", False):
-            # Bar height based on max font size (roughly)
-            max_font_size = max([e.font_size for e in burnin_config.elements])
-            bar_height = int(max_font_size * 2.0)
+        if bar_height:
+            roi = self.oiio.ROI(0, width, 0, bar_height)
+            multiplier = 1.0 - self._background_alpha(burnin_config)
+            self.oiio.ImageBufAlgo.mul(buf, buf, (multiplier, multiplier, multiplier, 1.0), roi)
+
+        self._render_elements(buf, frame_metadata, burnin_config, bar_height)
+        return buf
 
-            # Darken the area by multiplying
-            # background_opacity 30 means 30% darkening -> multiplier 0.7
-            opacity = getattr(burnin_config, "background_opacity", 30)
-            multiplier = 1.0 - (max(0, min(100, opacity)) / 100.0)
+    def render_overlay(
+        self,
+        width: int,
+        height: int,
+        frame_metadata: dict[str, Any],
+        burnin_config: Any,  # BurnInConfig
+    ) -> Any:
+        """Render the burn-ins onto a transparent RGBA ImageBuf.
+
+        Compositing the overlay with :meth:`composite_overlay` gives the same
+        result as :meth:`apply_burnins`, so it can be rendered once and reused.
+
+        Args:
+            width: Overlay width in pixels
+            height: Overlay height in pixels
+            frame_metadata: Metadata for token replacement
+            burnin_config: Configuration for burn-ins
+
+        Returns:
+            Premultiplied RGBA OIIO ImageBuf
+        """
+        spec = self.oiio.ImageSpec(width, height, 4, self.oiio.FLOAT)
+        spec.alpha_channel = 3
+        overlay = self.oiio.ImageBuf(spec)
+        if not burnin_config or not burnin_config.elements:
+            return overlay
 
+        bar_height = self._bar_height(burnin_config)
+        if bar_height:
+            # Black at the bar opacity darkens exactly like apply_burnins' multiply
             roi = self.oiio.ROI(0, width, 0, bar_height)
-            self.oiio.ImageBufAlgo.mul(buf, buf, (multiplier, multiplier, multiplier, 1.0), roi)
+            alpha = self._background_alpha(burnin_config)
+            self.oiio.ImageBufAlgo.fill(overlay, (0.0, 0.0, 0.0, alpha), roi)
+
+        self._render_elements(overlay, frame_metadata, burnin_config, bar_height)
+        return overlay
 
+    def composite_overlay(self, buf: Any, overlay: Any) -> Any:
+        """Composite an overlay from :meth:`render_overlay` over an ImageBuf.
+
+        Args:
+            buf: RGB or RGBA OIIO ImageBuf matching the overlay size
+            overlay: Premultiplied RGBA overlay
+
+        Returns:
+            Composited OIIO ImageBuf with the same channel count as ``buf``;
+            an alpha channel is copied from ``buf`` untouched
+        """
+        algo = self.oiio.ImageBufAlgo
+        nchannels = buf.spec().nchannels
+        if nchannels not in (3, 4):
+            raise ValueError(f"Cannot composite a burn-in overlay onto {nchannels} channels")
+        # Treat RGB as opaque for the composite, then drop the helper alpha
+        opaque = algo.channels(buf, (0, 1, 2, 1.0), ("R", "G", "B", "A"))
+        result = algo.channels(algo.over(overlay, opaque), (0, 1, 2))
+        if nchannels == 4 and not result.has_error:
+            # Burn-ins only change colour; the source alpha passes through unchanged
+            result = algo.channel_append(result, algo.channels(buf, (3,)))
+        if result.has_error:
+            raise RuntimeError(f"Failed to composite burn-in overlay: {result.geterror()}")
+        return result
+
+    def _bar_height(self, burnin_config: Any) -> int:
+        """Height of the background bar, or 0 when no bar is drawn."""
+        if not getattr(burnin_config, "use_background", False):
+            return 0
+        # Bar height based on max font size (roughly)
+        max_font_size = max([e.font_size for e in burnin_config.elements])
+        return int(max_font_size * 2.0)
+
+    def _background_alpha(self, burnin_config: Any) -> float:
+        """Darkening strength of the background bar.
+
+        background_opacity 30 means 30% darkening -> alpha 0.3 (multiplier 0.7).
+        """
+        opacity = getattr(burnin_config, "background_opacity", 30)
+        return max(0, min(100, opacity)) / 100.0
+
+    def _render_elements(
+        self,
+        buf: Any,
+        frame_metadata: dict[str, Any],
+        burnin_config: Any,
+        bar_height: int,
+    ) -> None:
+        """Render each burn-in element's text into ``buf``."""
+        width = buf.spec().width
         for element in burnin_config.elements:
             # Replace tokens in template
             text = self._replace_tokens(element.text_template, frame_metadata)
@@ -69,7 +151,7 @@ class BurnInProcessor:
             # Apply burn-in
             # Adjust Y to be within the bar if background is used
             y_pos = element.y
-            if getattr(burnin_config, "use_background", False) and y_pos < bar_height:
+            if bar_height and y_pos < bar_height:
                 # Center vertically in bar (render_text base is baseline)
                 y_pos = int(bar_height * 0.7)
 
@@ -85,8 +167,6 @@ class BurnInProcessor:
             ):
                 logger.error(f"Failed to render burn-in text '{text}': {self.oiio.geterror()}")
 
-        return buf
-
     def _replace_tokens(self, template: str, metadata: dict[str, Any]) -> str:
         """Replace tokens in the template with metadata values.
 
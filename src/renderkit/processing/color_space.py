@@ -247,6 +247,7 @@ class OCIOColorSpaceStrategy:
 
     def __init__(self) -> None:
         self._output_space: Optional[str] = None
+        self._resolved_inputs: dict[str, str] = {}
         self.config = None
         try:
             import PyOpenColorIO as OCIO
@@ -262,6 +263,13 @@ class OCIOColorSpaceStrategy:
         if not input_space or not self.config:
             return input_space
 
+        resolved = self._resolved_inputs.get(input_space)
+        if resolved is None:
+            resolved = self._lookup_input_space(input_space)
+            self._resolved_inputs[input_space] = resolved
+        return resolved
+
+    def _lookup_input_space(self, input_space: str) -> str:
         try:
             spaces = set(self.config.getColorSpaceNames())
         except Exception:
@@ -341,6 +349,9 @@ class OCIOColorSpaceStrategy:
         try:
             input_space = self._resolve_input_space(input_space)
             output_space = self._resolve_output_space()
+            if input_space == output_space:
+                # Identity transform: skip building an OCIO processor entirely
+                return _ensure_float_buf(oiio, buf)
             logger.debug(f"OCIO Conversion (ImageBuf): '{input_space}' -> '{output_space}'")
             return _oiio_colorconvert_buf(oiio, buf, [input_space], [output_space])
         except Exception as e:
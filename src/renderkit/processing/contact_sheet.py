@@ -1,6 +1,7 @@
 """Contact sheet generation logic for multi-AOV per-frame composites."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -91,14 +92,10 @@ class ContactSheetGenerator:
         canvas = oiio.ImageBuf(canvas_spec)
         oiio.ImageBufAlgo.fill(canvas, self.config.background_color)
 
-        # Process each layer
-        for i, layer_name in enumerate(layers):
-            row = i // cols
-            col = i % cols
-
-            x_offset = col * cell_w + padding
-            y_offset = row * cell_h + padding
-
+        # Reading and scaling are the heavy steps and each layer is independent;
+        # OIIO releases the GIL for both, so they can overlap across threads.
+        # Pasting and labels stay serial since they all write into the canvas.
+        def prepare(layer_name: str) -> Optional[oiio.ImageBuf]:
             try:
                 if layer_name == layers[0]:
                     layer_buf = first_buf
@@ -112,10 +109,32 @@ class ContactSheetGenerator:
                     )
 
                 if layer_buf.spec().width == thumb_w and layer_buf.spec().height == thumb_h:
-                    scaled_buf = layer_buf
-                else:
-                    scaled_buf = self._scale_to_thumbnail(layer_buf, thumb_w, thumb_h)
+                    return layer_buf
+                return self._scale_to_thumbnail(layer_buf, thumb_w, thumb_h)
+            except Exception as e:
+                logger.error(f"Failed to process layer {layer_name} for contact sheet: {e}")
+                return None
 
+        workers = min(self.config.layer_workers, len(layers))
+        if workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="renderkit-contact-sheet"
+            ) as executor:
+                scaled_bufs = list(executor.map(prepare, layers))
+        else:
+            scaled_bufs = [prepare(layer_name) for layer_name in layers]
+
+        # Process each layer
+        for i, (layer_name, scaled_buf) in enumerate(zip(layers, scaled_bufs, strict=True)):
+            if scaled_buf is None:
+                continue
+            row = i // cols
+            col = i % cols
+
+            x_offset = col * cell_w + padding
+            y_offset = row * cell_h + padding
+
+            try:
                 # Paste onto canvas
                 oiio.ImageBufAlgo.paste(canvas, x_offset, y_offset, 0, 0, scaled_buf)
 
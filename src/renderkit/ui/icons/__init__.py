@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Optional
 
-from renderkit.ui.qt_compat import QColor, QIcon, QPainter, QPixmap, Qt
+from renderkit.ui.qt_compat import QColor, QIcon, QPainter, QPixmap, QPixmapCache, Qt
 
 # Icon directory
 ICONS_DIR = Path(__file__).parent
@@ -64,6 +64,17 @@ class IconManager:
         self._icon_cache[cache_key] = icon
         return icon
 
+    def get_pixmap(self, name: str, color: Optional[str] = None, size: int = 16) -> QPixmap:
+        """Get a rasterized icon, shared across widgets through QPixmapCache."""
+        color_to_use = color if color is not None else self._default_color
+        cache_key = f"rk-icon:{name}:{color_to_use}:{size}"
+
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = self.get_icon(name, color=color_to_use, size=size).pixmap(size, size)
+            QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
+
     def set_default_color(self, color: Optional[str]) -> None:
         """Set default icon tint color for icons that don't specify one."""
         if color == self._default_color:
@@ -44,6 +44,9 @@ from renderkit.ui.qt_compat import (
 
 logger = logging.getLogger("renderkit.ui.main_window")
 
+# Threads the contact sheet preview uses to read and scale layers in parallel
+_PREVIEW_CONTACT_SHEET_WORKERS = min(4, os.cpu_count() or 1)
+
 RECENT_PATTERNS_LIMIT = 10
 RECENT_PATTERNS_KEY = "recent_patterns"
 RECENT_PATTERNS_CLEAR_LABEL = "Clear recent patterns"
@@ -94,6 +97,13 @@ class MainWindowLogicMixin:
 
         super().keyPressEvent(event)
 
+    def closeEvent(self, event) -> None:
+        """Stop the preview thread before the window goes away."""
+        preview_widget = getattr(self, "preview_widget", None)
+        if preview_widget is not None:
+            preview_widget.shutdown()
+        super().closeEvent(event)
+
     def _setup_logging(self) -> None:
         """Route renderkit logs into the UI log widget."""
         if self._log_forwarder is not None:
@@ -728,6 +738,7 @@ class MainWindowLogicMixin:
                 background_color=(0.1, 0.1, 0.1, 1.0),  # Dark background for preview
                 layer_width=layer_width,
                 layer_height=layer_height,
+                layer_workers=_PREVIEW_CONTACT_SHEET_WORKERS,
             )
             # Set layer to None to avoid "Layer not found" warnings when generator handles it
             layer = None
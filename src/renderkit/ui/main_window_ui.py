@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from importlib import resources
 from pathlib import Path
 from typing import Optional
@@ -18,6 +19,7 @@ from renderkit.ui.main_window_widgets import (
 )
 from renderkit.ui.qt_compat import (
     QT_BACKEND_NAME,
+    QBoxLayout,
     QCheckBox,
     QComboBox,
     QFont,
@@ -46,6 +48,53 @@ from renderkit.ui.widgets import PreviewWidget
 
 logger = logging.getLogger("renderkit.ui.main_window")
 
+_STATUS_ICON_SIZE = 16
+_STATUS_ICONS = {
+    "idle": "info",
+    "running": "loader",
+    "success": "check",
+    "error": "error",
+    "cancelled": "warning",
+}
+_STATUS_COLORS = {
+    "light": {
+        "idle": "#656d76",
+        "running": "#0969da",
+        "success": "#1a7f37",
+        "error": "#d1242f",
+        "cancelled": "#9a6700",
+    },
+    "dark": {
+        "idle": "#848d97",
+        "running": "#4493f8",
+        "success": "#3fb950",
+        "error": "#f85149",
+        "cancelled": "#d29922",
+    },
+}
+
+# (title, content builder, collapsed, attribute name) for each settings section.
+_SETTINGS_SECTIONS = (
+    ("Input Sequence", "_create_input_sequence_content", False, None),
+    ("Output Settings", "_create_output_content", True, None),
+    ("Burn-in Overlays", "_create_burnin_content", True, None),
+    ("Contact Sheet", "_create_contact_sheet_content", True, "cs_section"),
+    ("Advanced Options", "_create_advanced_content", True, None),
+)
+
+
+def _box_layout(
+    layout_cls: type[QBoxLayout],
+    parent: Optional[QWidget] = None,
+    margins: int = 0,
+    spacing: int = 6,
+) -> QBoxLayout:
+    """Create a box layout with uniform margins and spacing."""
+    layout = layout_cls(parent) if parent is not None else layout_cls()
+    layout.setContentsMargins(margins, margins, margins, margins)
+    layout.setSpacing(spacing)
+    return layout
+
 
 class MainWindowUiMixin:
     """UI construction and layout helpers."""
@@ -55,6 +104,8 @@ class MainWindowUiMixin:
         theme_name = "dark"
         self.setProperty("theme", theme_name)
         icon_manager.set_default_color("#e6edf3" if theme_name == "dark" else "#1f2328")
+        if os.environ.get("RENDERKIT_DISABLE_STYLESHEET", "").lower() in {"1", "true", "yes", "on"}:
+            return
         try:
             qss_text = (
                 resources.files("renderkit.ui")
@@ -236,38 +287,15 @@ class MainWindowUiMixin:
 
         # Container for all collapsible sections
         container = QWidget()
-        container_layout = QVBoxLayout(container)
-        container_layout.setContentsMargins(5, 5, 5, 5)
-        container_layout.setSpacing(8)
-
-        # Input Sequence Section (includes color space)
-        input_section = CollapsibleGroupBox("Input Sequence")
-        input_section.set_content_layout(self._create_input_sequence_content())
-        container_layout.addWidget(input_section)
-
-        # Output Settings Section
-        output_section = CollapsibleGroupBox("Output Settings")
-        output_section.set_content_layout(self._create_output_content())
-        output_section.set_collapsed(True)
-        container_layout.addWidget(output_section)
-
-        # Burn-in Overlays Section
-        burnin_section = CollapsibleGroupBox("Burn-in Overlays")
-        burnin_section.set_content_layout(self._create_burnin_content())
-        burnin_section.set_collapsed(True)
-        container_layout.addWidget(burnin_section)
-
-        # Contact Sheet Section
-        self.cs_section = CollapsibleGroupBox("Contact Sheet")
-        self.cs_section.set_content_layout(self._create_contact_sheet_content())
-        self.cs_section.set_collapsed(True)
-        container_layout.addWidget(self.cs_section)
-
-        # Advanced Options Section (includes video encoding)
-        advanced_section = CollapsibleGroupBox("Advanced Options")
-        advanced_section.set_content_layout(self._create_advanced_content())
-        advanced_section.set_collapsed(True)
-        container_layout.addWidget(advanced_section)
+        container_layout = _box_layout(QVBoxLayout, container, margins=5, spacing=8)
+
+        for title, builder, collapsed, attr_name in _SETTINGS_SECTIONS:
+            section = CollapsibleGroupBox(title)
+            section.set_content_layout(getattr(self, builder)())
+            section.set_collapsed(collapsed)
+            container_layout.addWidget(section)
+            if attr_name is not None:
+                setattr(self, attr_name, section)
 
         container_layout.addStretch()
 
@@ -376,12 +404,6 @@ class MainWindowUiMixin:
         grid_layout.setColumnStretch(2, 0)
         grid_layout.setColumnStretch(3, 1)
 
-        def _row_layout(spacing: int = 6) -> QHBoxLayout:
-            layout = QHBoxLayout()
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.setSpacing(spacing)
-            return layout
-
         align_left = Qt.AlignmentFlag.AlignLeft
 
         # Output path
@@ -401,7 +423,7 @@ class MainWindowUiMixin:
         grid_layout.addLayout(output_path_layout, 0, 1, 1, 3)
 
         # Frame Range
-        frame_range_layout = _row_layout()
+        frame_range_layout = _box_layout(QHBoxLayout)
         self.start_frame_spin = NoWheelSpinBox()
         self.start_frame_spin.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         self.start_frame_spin.setMinimum(1)
@@ -439,7 +461,7 @@ class MainWindowUiMixin:
         self.fps_spin.setDecimals(3)
         self.fps_spin.setValue(24.0)
         self.fps_spin.setSuffix(" fps")
-        fps_layout = _row_layout()
+        fps_layout = _box_layout(QHBoxLayout)
         fps_layout.addWidget(self.fps_spin)
         self.keep_source_fps_check = QCheckBox("Keep Source FPS")
         self.keep_source_fps_check.setChecked(True)
@@ -454,7 +476,7 @@ class MainWindowUiMixin:
         )
 
         # Resolution
-        resolution_layout = _row_layout()
+        resolution_layout = _box_layout(QHBoxLayout)
         self.width_spin = NoWheelSpinBox()
         self.width_spin.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         self.width_spin.setMinimum(1)
@@ -512,9 +534,7 @@ class MainWindowUiMixin:
             self.open_output_btn.setObjectName("IconButton")
             self.open_output_btn.setIcon(icon_manager.get_icon("file_folder"))
 
-        output_actions_layout = QHBoxLayout()
-        output_actions_layout.setContentsMargins(0, 0, 0, 0)
-        output_actions_layout.setSpacing(8)
+        output_actions_layout = _box_layout(QHBoxLayout, spacing=8)
         output_actions_layout.addWidget(self.play_btn)
         output_actions_layout.addWidget(self.open_output_btn)
         output_actions_layout.addStretch()
@@ -568,9 +588,7 @@ class MainWindowUiMixin:
         self.progress_folder_btn.setVisible(False)
         self.progress_folder_btn.clicked.connect(self._open_output_folder)
 
-        status_layout = QHBoxLayout()
-        status_layout.setContentsMargins(0, 0, 0, 0)
-        status_layout.setSpacing(6)
+        status_layout = _box_layout(QHBoxLayout)
         status_layout.addStretch()
         status_layout.addWidget(self.progress_label)
         status_layout.addWidget(self.progress_play_btn)
@@ -600,6 +618,7 @@ class MainWindowUiMixin:
 
         layout.addWidget(log_group)
 
+        self._build_status_pixmaps()
         self._set_status_icons("idle")
 
         return panel
@@ -625,9 +644,7 @@ class MainWindowUiMixin:
         timeline_layout.setContentsMargins(6, 4, 6, 0)
         timeline_layout.setSpacing(4)
 
-        timeline_row = QHBoxLayout()
-        timeline_row.setContentsMargins(0, 0, 0, 0)
-        timeline_row.setSpacing(6)
+        timeline_row = _box_layout(QHBoxLayout)
         self.timeline_start_label = QLabel("--")
         self.timeline_start_label.setObjectName("TimelineLabel")
         self.timeline_start_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -772,30 +789,28 @@ class MainWindowUiMixin:
         self.burnin_fps_check.setChecked(True)
         layout.addWidget(self.burnin_fps_check)
 
-        # Font size
-        font_size_layout = QHBoxLayout()
-        font_size_layout.addWidget(QLabel("Font Size:"))
+        form_layout = QFormLayout()
+        form_layout.setSpacing(10)
+        self._set_form_growth_policy(form_layout)
+
         self.burnin_font_size_spin = NoWheelSpinBox()
+        self.burnin_font_size_spin.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         self.burnin_font_size_spin.setRange(6, 72)
         self.burnin_font_size_spin.setValue(20)
         self.burnin_font_size_spin.setSuffix(" pt")
         self.burnin_font_size_spin.setToolTip(
             "Font size for burn-ins and contact sheet layer labels."
         )
-        font_size_layout.addWidget(self.burnin_font_size_spin)
-        font_size_layout.addStretch()
-        layout.addLayout(font_size_layout)
+        form_layout.addRow("Font Size:", self.burnin_font_size_spin)
 
-        # Opacity
-        opacity_layout = QHBoxLayout()
-        opacity_layout.addWidget(QLabel("Background Opacity:"))
         self.burnin_opacity_spin = NoWheelSpinBox()
+        self.burnin_opacity_spin.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         self.burnin_opacity_spin.setRange(0, 100)
         self.burnin_opacity_spin.setValue(30)
         self.burnin_opacity_spin.setSuffix("%")
-        opacity_layout.addWidget(self.burnin_opacity_spin)
-        opacity_layout.addStretch()
-        layout.addLayout(opacity_layout)
+        form_layout.addRow("Background Opacity:", self.burnin_opacity_spin)
+
+        layout.addLayout(form_layout)
 
         return layout
 
@@ -888,39 +903,22 @@ class MainWindowUiMixin:
             return theme
         return "dark"
 
-    def _get_status_color(self, status: str) -> str:
-        theme = self._get_theme_name()
-        if theme == "light":
-            colors = {
-                "idle": "#656d76",
-                "running": "#0969da",
-                "success": "#1a7f37",
-                "error": "#d1242f",
-                "cancelled": "#9a6700",
-            }
-        else:
-            colors = {
-                "idle": "#848d97",
-                "running": "#4493f8",
-                "success": "#3fb950",
-                "error": "#f85149",
-                "cancelled": "#d29922",
-            }
-        return colors.get(status, colors["idle"])
+    def _build_status_pixmaps(self) -> None:
+        """Rasterize every status icon once for both themes."""
+        self._status_pixmaps = {
+            status: tuple(
+                icon_manager.get_pixmap(
+                    icon_name, color=_STATUS_COLORS[theme][status], size=_STATUS_ICON_SIZE
+                )
+                for theme in ("light", "dark")
+            )
+            for status, icon_name in _STATUS_ICONS.items()
+        }
 
     def _set_status_icons(self, status: str) -> None:
         if not hasattr(self, "progress_status_icon"):
             return
 
-        icon_map = {
-            "idle": "info",
-            "running": "loader",
-            "success": "check",
-            "error": "error",
-            "cancelled": "warning",
-        }
-        icon_name = icon_map.get(status, "info")
-        color = self._get_status_color(status)
-        icon = icon_manager.get_icon(icon_name, color=color, size=16)
-        pixmap = icon.pixmap(16, 16)
-        self.progress_status_icon.setPixmap(pixmap)
+        pixmaps = self._status_pixmaps.get(status, self._status_pixmaps["idle"])
+        theme_index = 0 if self._get_theme_name() == "light" else 1
+        self.progress_status_icon.setPixmap(pixmaps[theme_index])
@@ -1,6 +1,7 @@
 """Shared UI widgets for the RenderKit main window."""
 
 from renderkit.ui.qt_compat import (
+    QT_BACKEND_NAME,
     QComboBox,
     QDoubleSpinBox,
     QObject,
@@ -13,6 +14,18 @@ from renderkit.ui.qt_compat import (
     Signal,
 )
 
+if QT_BACKEND_NAME in ("pyside6", "pyqt6"):
+
+    def _event_pos(event):
+        """Return the integer position of a Qt6 mouse event."""
+        return event.position().toPoint()
+
+else:
+
+    def _event_pos(event):
+        """Return the integer position of a Qt5 mouse event."""
+        return event.pos()
+
 
 class NoWheelSpinBox(QSpinBox):
     """Spin box that ignores wheel events unless focused."""
@@ -96,7 +109,7 @@ class JumpToClickSlider(NoWheelSlider):
         if event.button() == Qt.MouseButton.LeftButton:
             option = QStyleOptionSlider()
             self.initStyleOption(option)
-            position = event.position().toPoint() if hasattr(event, "position") else event.pos()
+            position = _event_pos(event)
 
             groove = self.style().subControlRect(
                 QStyle.ComplexControl.CC_Slider,
@@ -1,8 +1,17 @@
-"""Qt compatibility layer for PyQt5, PyQt6, PySide2, and PySide6."""
+"""Qt compatibility layer for PyQt5, PyQt6, PySide2, and PySide6.
+
+Qt classes are exposed lazily: each name is imported from the detected
+backend the first time it is accessed and then cached on this module.
+
+Only names that RenderKit actually imports are listed here. When a module
+needs a new Qt class, add it to the matching ``_QT*_NAMES`` list and to the
+``TYPE_CHECKING`` imports below; drop names once nothing references them.
+"""
 
 import importlib
+import importlib.util
 import os
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 _BACKEND_ORDER = ("pyside6", "pyside2", "pyqt6", "pyqt5")
 _BACKEND_MODULES = {
@@ -32,9 +41,11 @@ _QTGUI_NAMES = [
     "QPainter",
     "QPalette",
     "QPixmap",
+    "QPixmapCache",
 ]
 _QTWIDGET_NAMES = [
     "QApplication",
+    "QBoxLayout",
     "QCheckBox",
     "QComboBox",
     "QDoubleSpinBox",
@@ -59,7 +70,6 @@ _QTWIDGET_NAMES = [
     "QStyle",
     "QStyleOptionSlider",
     "QSystemTrayIcon",
-    "QTabWidget",
     "QToolButton",
     "QVBoxLayout",
     "QWidget",
@@ -76,6 +86,7 @@ if TYPE_CHECKING:
         QThread,
         QTimer,
         QUrl,
+        Signal,
     )
     from PySide6.QtGui import (  # noqa: F401
         QColor,
@@ -86,9 +97,11 @@ if TYPE_CHECKING:
         QPainter,
         QPalette,
         QPixmap,
+        QPixmapCache,
     )
     from PySide6.QtWidgets import (  # noqa: F401
         QApplication,
+        QBoxLayout,
         QCheckBox,
         QComboBox,
         QDoubleSpinBox,
@@ -113,115 +126,81 @@ if TYPE_CHECKING:
         QStyle,
         QStyleOptionSlider,
         QSystemTrayIcon,
-        QTabWidget,
         QToolButton,
         QVBoxLayout,
         QWidget,
     )
 
 # Try to detect which Qt backend to use
-# Priority: Environment variable > PySide6 > PySide2 > PyQt6 > PyQt5
-QT_BACKEND: Optional[str] = os.environ.get("QT_BACKEND", "").lower()
+# Priority: RENDERKIT_QT_BACKEND > QT_BACKEND > PySide6 > PySide2 > PyQt6 > PyQt5
+_BACKEND_ENV_VAR = (
+    "RENDERKIT_QT_BACKEND" if os.environ.get("RENDERKIT_QT_BACKEND") else "QT_BACKEND"
+)
+QT_BACKEND: Optional[str] = os.environ.get(_BACKEND_ENV_VAR, "").lower()
 
 if QT_BACKEND:
-    # User specified backend
+    # User specified backend; skip probing installed bindings entirely
     if QT_BACKEND in _BACKEND_MODULES:
         _backend = QT_BACKEND
     else:
         raise ValueError(
-            f"Invalid QT_BACKEND: {QT_BACKEND}. Must be one of: pyside6, pyside2, pyqt6, pyqt5"
+            f"Invalid {_BACKEND_ENV_VAR}: {QT_BACKEND}. "
+            "Must be one of: pyside6, pyside2, pyqt6, pyqt5"
         )
 else:
-    # Auto-detect: try in order of preference
+    # Auto-detect: find_spec locates each package without executing its __init__
     _backend = None
     for backend in _BACKEND_ORDER:
-        try:
-            importlib.import_module(_BACKEND_MODULES[backend])
-        except ImportError:
-            continue
-        _backend = backend
-        break
+        if importlib.util.find_spec(_BACKEND_MODULES[backend]) is not None:
+            _backend = backend
+            break
 
 if _backend is None:
     raise ImportError(
         "No Qt backend found. Please install one of: PySide6, PySide2, PyQt6, or PyQt5"
     )
 
-# Import based on detected backend
+# Qt symbols are resolved lazily (PEP 562) so importing this module only pays
+# for the Qt submodules and classes a caller actually touches.
 _module = _BACKEND_MODULES[_backend]
-_qtcore = importlib.import_module(f"{_module}.QtCore")
-_qtgui = importlib.import_module(f"{_module}.QtGui")
-_qtwidgets = importlib.import_module(f"{_module}.QtWidgets")
-
-for name in _QTCORE_NAMES:
-    globals()[name] = getattr(_qtcore, name)
-for name in _QTGUI_NAMES:
-    globals()[name] = getattr(_qtgui, name)
-for name in _QTWIDGET_NAMES:
-    globals()[name] = getattr(_qtwidgets, name)
-
-if _backend in ("pyqt6", "pyqt5"):
-    Signal = _qtcore.pyqtSignal
-else:
-    Signal = _qtcore.Signal
+_LAZY_NAMES: dict[str, tuple[str, str]] = {
+    **{name: ("QtCore", name) for name in _QTCORE_NAMES},
+    **{name: ("QtGui", name) for name in _QTGUI_NAMES},
+    **{name: ("QtWidgets", name) for name in _QTWIDGET_NAMES},
+    "Signal": ("QtCore", "pyqtSignal" if _backend in ("pyqt6", "pyqt5") else "Signal"),
+}
+
+# Imported Qt submodules, keyed by short name ("QtCore", ...)
+_SUBMODULES: dict[str, Any] = {}
 
 # Export backend info
 QT_BACKEND_NAME = _backend
 
-__all__ = [
-    # Qt Core
-    "QObject",
-    "QSettings",
-    "QThread",
-    "Signal",
-    "Qt",
-    "QTimer",
-    "QUrl",
-    "QEvent",
-    "QSize",
-    "QPoint",
-    # Qt Gui
-    "QFont",
-    "QIcon",
-    "QPixmap",
-    "QImage",
-    "QDesktopServices",
-    "QColor",
-    "QPainter",
-    "QPalette",
-    # Qt Widgets
-    "QApplication",
-    "QCheckBox",
-    "QComboBox",
-    "QFileDialog",
-    "QFormLayout",
-    "QFrame",
-    "QGridLayout",
-    "QGroupBox",
-    "QHBoxLayout",
-    "QLabel",
-    "QLineEdit",
-    "QMainWindow",
-    "QMessageBox",
-    "QPlainTextEdit",
-    "QProgressBar",
-    "QPushButton",
-    "QScrollArea",
-    "QSizePolicy",
-    "QSlider",
-    "QSpinBox",
-    "QDoubleSpinBox",
-    "QSplitter",
-    "QStyle",
-    "QStyleOptionSlider",
-    "QSystemTrayIcon",
-    "QTabWidget",
-    "QToolButton",
-    "QVBoxLayout",
-    "QWidget",
-    # Backend info
-    "QT_BACKEND_NAME",
-]
+__all__ = [*_LAZY_NAMES, "QT_BACKEND_NAME"]
+
+
+def _sub(submodule: str) -> Any:
+    """Return a backend submodule, importing it at most once."""
+    module = _SUBMODULES.get(submodule)
+    if module is None:
+        module = importlib.import_module(f"{_module}.{submodule}")
+        _SUBMODULES[submodule] = module
+    return module
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a Qt symbol on first access and cache it in the module globals."""
+    try:
+        submodule, attr = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(_sub(submodule), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
 
 def get_qt_backend() -> str:
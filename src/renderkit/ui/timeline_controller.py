@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Sequence
+from itertools import pairwise
 from pathlib import Path
 from typing import Optional
 
@@ -11,6 +13,9 @@ from renderkit.ui.qt_compat import QLabel, QSlider, QTimer, QWidget
 
 PreviewLoader = Callable[[Path, bool], None]
 
+_FRAME_LABEL_FORMAT = "Frame: {}"
+_SCRUB_INTERVAL_MS = 40
+
 
 class TimelineController:
     """Manage timeline scrubber state and preview updates."""
@@ -33,15 +38,19 @@ class TimelineController:
         self._load_preview = load_preview
 
         self._sequence: Optional[FrameSequence] = None
-        self._frames: list[int] = []
+        self._frames: Sequence[int] = ()
+        self._frame_count = 0
         self._pending_frame: Optional[int] = None
         self._last_frame: Optional[int] = None
+        self._label_frame: Optional[int] = None
+        self._last_scrub_time = float("-inf")
         self._is_scrubbing = False
         self._sync_guard = False
 
+        # Trailing-edge timer: guarantees the final slider position is applied
         self._timer = QTimer(parent or container)
         self._timer.setSingleShot(True)
-        self._timer.setInterval(40)
+        self._timer.setInterval(_SCRUB_INTERVAL_MS)
         self._timer.timeout.connect(self._apply_scrub)
 
         self._slider.valueChanged.connect(self._on_slider_changed)
@@ -53,9 +62,11 @@ class TimelineController:
     def reset(self) -> None:
         """Hide and reset the timeline UI and state."""
         self._sequence = None
-        self._frames = []
+        self._frames = ()
+        self._frame_count = 0
         self._pending_frame = None
         self._last_frame = None
+        self._label_frame = None
         self._is_scrubbing = False
         self._sync_guard = False
         self._timer.stop()
@@ -77,10 +88,16 @@ class TimelineController:
             return
 
         self._sequence = sequence
-        self._frames = frame_numbers
         first_frame = frame_numbers[0]
         last_frame = frame_numbers[-1]
-        max_index = len(frame_numbers) - 1
+        # Contiguous sequences (the common case) are stored as a range: O(1) memory
+        # and indexing, independent of the frame count.
+        if all(b == a + 1 for a, b in pairwise(frame_numbers)):
+            self._frames = range(first_frame, last_frame + 1)
+        else:
+            self._frames = frame_numbers
+        self._frame_count = len(frame_numbers)
+        max_index = self._frame_count - 1
 
         self._sync_guard = True
         self._slider.blockSignals(True)
@@ -93,30 +110,45 @@ class TimelineController:
 
         self._start_label.setText(str(first_frame))
         self._end_label.setText(str(last_frame))
-        self._current_label.setText(f"Frame: {first_frame}")
+        self._label_frame = None
+        self._set_current_label(first_frame)
         self._container.setVisible(True)
 
         self._pending_frame = None
         self._last_frame = None
 
     def _frame_from_index(self, index: int) -> Optional[int]:
-        if not self._frames:
+        if not self._frame_count:
             return None
         if index <= 0:
             return self._frames[0]
-        if index >= len(self._frames):
+        if index >= self._frame_count:
             return self._frames[-1]
         return self._frames[index]
 
+    def _set_current_label(self, frame: int) -> None:
+        # Only repaint the label when the displayed frame actually changes
+        if frame == self._label_frame:
+            return
+        self._label_frame = frame
+        self._current_label.setText(_FRAME_LABEL_FORMAT.format(frame))
+
     def _on_slider_changed(self, value: int) -> None:
         if self._sync_guard or not self._sequence:
             return
         frame = self._frame_from_index(value)
         if frame is None:
             return
-        self._current_label.setText(f"Frame: {frame}")
+        # The label is updated with the preview, at most once per scrub interval.
+        # Apply immediately when the interval has elapsed; otherwise arm the
+        # trailing timer once instead of restarting it on every tick.
         self._pending_frame = frame
-        self._timer.start()
+        elapsed_ms = (time.monotonic() - self._last_scrub_time) * 1000.0
+        if elapsed_ms >= _SCRUB_INTERVAL_MS:
+            self._timer.stop()
+            self._apply_scrub()
+        elif not self._timer.isActive():
+            self._timer.start()
 
     def _on_scrub_started(self) -> None:
         self._is_scrubbing = True
@@ -131,6 +163,7 @@ class TimelineController:
             return
         self._pending_frame = None
         self._last_frame = None
+        self._set_current_label(frame)
         path = self._sequence.get_file_path(frame)
         self._load_preview(path, False)
 
@@ -139,6 +172,8 @@ class TimelineController:
             return
         frame = self._pending_frame
         self._pending_frame = None
+        self._last_scrub_time = time.monotonic()
+        self._set_current_label(frame)
         if self._last_frame == frame:
             return
         self._last_frame = frame
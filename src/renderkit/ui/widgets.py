@@ -1,16 +1,16 @@
 """Custom widgets for the UI."""
 
+from __future__ import annotations
+
+import functools
 import logging
+import math
+import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
-
-import numpy as np
-import OpenImageIO as oiio
+from typing import TYPE_CHECKING, Any, Optional
 
-from renderkit.core.config import BurnInConfig, ContactSheetConfig
-from renderkit.io.image_reader import ImageReaderFactory
-from renderkit.io.oiio_cache import get_shared_image_cache
-from renderkit.processing.color_space import ColorSpaceConverter, ColorSpacePreset
 from renderkit.ui.icons import icon_manager
 from renderkit.ui.qt_compat import (
     QApplication,
@@ -18,6 +18,7 @@ from renderkit.ui.qt_compat import (
     QHBoxLayout,
     QImage,
     QLabel,
+    QObject,
     QPixmap,
     QPoint,
     QPushButton,
@@ -31,13 +32,131 @@ from renderkit.ui.qt_compat import (
     Signal,
 )
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from renderkit.core.config import BurnInConfig, ContactSheetConfig
+    from renderkit.processing.color_space import ColorSpaceConverter, ColorSpacePreset
 
+logger = logging.getLogger(__name__)
 
-class PreviewWorker(QThread):
-    """Worker thread for loading preview image."""
 
-    preview_ready = Signal(QPixmap)
+def _resolve_image_format(name: str) -> Any:
+    """Return a QImage format enum for both Qt6 (scoped) and Qt5 (flat) bindings."""
+    format_enum = getattr(QImage, "Format", None)
+    if format_enum is not None and hasattr(format_enum, name):
+        return getattr(format_enum, name)
+    return getattr(QImage, name)
+
+
+_RGB32_FORMAT = _resolve_image_format("Format_RGB32")
+_ARGB32_FORMAT = _resolve_image_format("Format_ARGB32")
+_GRAY8_FORMAT = _resolve_image_format("Format_Grayscale8")
+# QImage formats for previews, keyed by the source channel count
+_FORMATS_BY_CHANNELS = {1: _GRAY8_FORMAT, 3: _RGB32_FORMAT, 4: _ARGB32_FORMAT}
+# Qt's 32-bit formats store native-endian 0xAARRGGBB words, which is what QPixmap
+# uses internally. OIIO reorders RGB(A) into that byte layout (filling opaque alpha
+# for RGB) so Qt can copy rows verbatim instead of swizzling 24-bit pixels.
+if sys.byteorder == "little":
+    _QT32_CHANNEL_ORDER: dict[int, tuple] = {3: (2, 1, 0, 1.0), 4: (2, 1, 0, 3)}
+else:
+    _QT32_CHANNEL_ORDER = {3: (1.0, 0, 1, 2), 4: (3, 0, 1, 2)}
+_KEEP_ASPECT = Qt.AspectRatioMode.KeepAspectRatio
+_SMOOTH_TRANSFORM = Qt.TransformationMode.SmoothTransformation
+_FAST_TRANSFORM = Qt.TransformationMode.FastTransformation
+# Downscales gentler than this use nearest-neighbour sampling; the difference is not visible
+_FAST_SCALE_RATIO = 1.5
+# Fullscreen zoom pyramids stop halving below this edge length
+_MIN_MIP_SIZE = 64
+_LABEL_STYLE_IDLE = """
+    QLabel {
+        background-color: #2b2b2b;
+        color: #888;
+        border: 1px solid #444;
+        border-radius: 4px;
+    }
+"""
+_LABEL_STYLE_ERROR = """
+    QLabel {
+        background-color: #2b2b2b;
+        color: #f44336;
+        border: 1px solid #444;
+        border-radius: 4px;
+    }
+"""
+# Upper bound on decoded preview images kept for timeline revisits
+_PREVIEW_CACHE_BYTES = 256 * 1024 * 1024
+# Rendered burn-in overlays, keyed by size, config and metadata
+_BURNIN_OVERLAYS: OrderedDict[tuple, Any] = OrderedDict()
+_BURNIN_OVERLAY_LIMIT = 8
+_BURNIN_OVERLAY_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8)
+def _preview_converter(preset: ColorSpacePreset) -> ColorSpaceConverter:
+    """Return a shared converter per preset so OCIO config lookups happen once."""
+    from renderkit.processing.color_space import ColorSpaceConverter
+
+    return ColorSpaceConverter(preset)
+
+
+def _burnin_overlay(
+    width: int, height: int, burnin_config: BurnInConfig, metadata: dict[str, Any]
+) -> Any:
+    """Return the RGBA burn-in overlay for a frame, rendering text only on a miss.
+
+    Burn-in configs are mutable dataclasses, so the key uses their repr rather
+    than relying on ``functools.lru_cache`` hashing.
+    """
+    from renderkit.processing.burnin import BurnInProcessor
+
+    key = (width, height, repr(burnin_config), repr(sorted(metadata.items())))
+    with _BURNIN_OVERLAY_LOCK:
+        overlay = _BURNIN_OVERLAYS.get(key)
+        if overlay is not None:
+            _BURNIN_OVERLAYS.move_to_end(key)
+            return overlay
+
+    overlay = BurnInProcessor().render_overlay(width, height, metadata, burnin_config)
+    with _BURNIN_OVERLAY_LOCK:
+        _BURNIN_OVERLAYS[key] = overlay
+        while len(_BURNIN_OVERLAYS) > _BURNIN_OVERLAY_LIMIT:
+            _BURNIN_OVERLAYS.popitem(last=False)
+    return overlay
+
+
+def _image_bytes(image: QImage) -> int:
+    """Memory held by a preview image."""
+    return image.height() * image.bytesPerLine()
+
+
+def _fit_pixmap(
+    pixmap: QPixmap, target: QSize, fast: bool = False, fast_mild_downscale: bool = False
+) -> QPixmap:
+    """Scale a pixmap to fit ``target``, keeping aspect ratio.
+
+    Returns the pixmap unchanged when it already fits exactly. ``fast`` forces
+    nearest-neighbour sampling for transient frames; otherwise the result is
+    smoothly filtered. ``fast_mild_downscale`` also takes the nearest-neighbour
+    path for downscales gentler than _FAST_SCALE_RATIO, where it is not visible.
+    """
+    fitted = pixmap.size().scaled(target, _KEEP_ASPECT)
+    if fitted == pixmap.size() or fitted.isEmpty():
+        return pixmap
+    ratio = pixmap.width() / fitted.width()
+    if fast or (fast_mild_downscale and 1.0 < ratio < _FAST_SCALE_RATIO):
+        mode = _FAST_TRANSFORM
+    else:
+        mode = _SMOOTH_TRANSFORM
+    return pixmap.scaled(fitted, _KEEP_ASPECT, mode)
+
+
+class PreviewWorker(QObject):
+    """A single preview request.
+
+    ``render`` does the actual work and may be called from any thread;
+    ``run`` wraps it and reports the outcome through signals.
+    """
+
+    preview_ready = Signal(QImage)
     error = Signal(str)
 
     def __init__(
@@ -50,6 +169,7 @@ class PreviewWorker(QThread):
         burnin_config: Optional[BurnInConfig] = None,
         burnin_metadata: Optional[dict[str, Any]] = None,
         preview_scale: float = 1.0,
+        preview_filter: str = "triangle",
     ) -> None:
         """Initialize preview worker.
 
@@ -61,6 +181,8 @@ class PreviewWorker(QThread):
             cs_config: Optional contact sheet configuration
             burnin_config: Optional burn-in configuration
             burnin_metadata: Optional burn-in metadata for token replacement
+            preview_scale: Scaling factor applied before color conversion
+            preview_filter: OIIO filter used when downscaling for the preview
         """
         super().__init__()
         self.file_path = file_path
@@ -71,103 +193,292 @@ class PreviewWorker(QThread):
         self.burnin_config = burnin_config
         self.burnin_metadata = burnin_metadata
         self.preview_scale = preview_scale
+        self.preview_filter = preview_filter
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the worker to stop at its next checkpoint without emitting a result."""
+        self._cancel.set()
+
+    def is_cancelled(self) -> bool:
+        """Return True if cancel() has been requested."""
+        return self._cancel.is_set()
+
+    def cache_key(self) -> Optional[tuple]:
+        """Return a key identifying this request's output, or None if the file is missing.
+
+        The key includes the file's mtime and size so edited frames are re-rendered.
+        """
+        try:
+            stat = Path(self.file_path).stat()
+        except OSError:
+            return None
+        return (
+            str(self.file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            self.color_space,
+            self.input_space,
+            self.layer,
+            self.preview_scale,
+            self.preview_filter,
+            repr(self.cs_config),
+            repr(self.burnin_config),
+            repr(sorted((self.burnin_metadata or {}).items())),
+        )
 
     def run(self) -> None:
-        """Load and process preview image."""
+        """Render the preview and emit ``preview_ready`` or ``error``."""
         try:
-            if self.cs_config:
-                from renderkit.processing.contact_sheet import ContactSheetGenerator
+            image = self.render()
+        except Exception as e:
+            if not self.is_cancelled():
+                self.error.emit(str(e))
+            return
+        if image is not None and not self.is_cancelled():
+            self.preview_ready.emit(image)
 
-                generator = ContactSheetGenerator(self.cs_config)
-                buf = generator.composite_layers(self.file_path)
-            else:
-                reader = ImageReaderFactory.create_reader(
-                    self.file_path, image_cache=get_shared_image_cache()
-                )
-                buf = reader.read_imagebuf(self.file_path, layer=self.layer)
+    def render(self) -> Optional[QImage]:
+        """Load and process the preview image.
 
-            # Apply preview scale
-            if self.preview_scale < 1.0:
-                spec = buf.spec()
-                h, w = spec.height, spec.width
-                new_w = max(1, int(w * self.preview_scale))
-                new_h = max(1, int(h * self.preview_scale))
+        The result is a QImage rather than a QPixmap: it is a plain CPU buffer
+        that is cheap to hand across threads, and the GUI thread converts it.
+
+        Returns:
+            The preview image, or None if the request was cancelled.
+
+        Raises:
+            Exception: Any failure while reading or processing the image.
+        """
+        # Heavy imaging imports are deferred to the worker thread so building
+        # the preview widget does not pay for them on the UI thread.
+        import numpy as np
+        import OpenImageIO as oiio
+
+        from renderkit.io.image_reader import ImageReaderFactory
+        from renderkit.io.oiio_cache import get_shared_image_cache
+
+        if self.cs_config:
+            from renderkit.processing.contact_sheet import ContactSheetGenerator
+
+            generator = ContactSheetGenerator(self.cs_config)
+            buf = generator.composite_layers(self.file_path)
+        else:
+            reader = ImageReaderFactory.create_reader(
+                self.file_path, image_cache=get_shared_image_cache()
+            )
+            buf = reader.read_imagebuf(self.file_path, layer=self.layer)
+        if self.is_cancelled():
+            return None
+
+        # Apply preview scale on the ImageBuf, before color conversion, numpy and
+        # Qt ever see the full-resolution pixels. OIIO widens the filter to the
+        # downscale ratio, so a cheap triangle filter still avoids aliasing.
+        if self.preview_scale < 1.0:
+            spec = buf.spec()
+            h, w = spec.height, spec.width
+            new_w = max(1, int(w * self.preview_scale))
+            new_h = max(1, int(h * self.preview_scale))
+            if (new_w, new_h) != (w, h):
                 from renderkit.processing.scaler import ImageScaler
 
-                buf = ImageScaler.scale_buf(buf, width=new_w, height=new_h)
+                buf = ImageScaler.scale_buf(
+                    buf, width=new_w, height=new_h, filter_name=self.preview_filter
+                )
+
+        if self.is_cancelled():
+            return None
 
-            # Convert color space
-            converter = ColorSpaceConverter(self.color_space)
-            buf = converter.convert_buf(buf, input_space=self.input_space)
+        # Convert color space
+        converter = _preview_converter(self.color_space)
+        buf = converter.convert_buf(buf, input_space=self.input_space)
 
-            if self.burnin_config and self.burnin_metadata:
-                try:
-                    from renderkit.processing.burnin import BurnInProcessor
+        if self.burnin_config and self.burnin_metadata:
+            try:
+                from renderkit.processing.burnin import BurnInProcessor
 
-                    processor = BurnInProcessor()
+                processor = BurnInProcessor()
+                spec = buf.spec()
+                if spec.nchannels in (3, 4):
+                    # Text rasterization is cached per frame; switching color
+                    # space or revisiting a frame only pays for the composite.
+                    overlay = _burnin_overlay(
+                        spec.width, spec.height, self.burnin_config, self.burnin_metadata
+                    )
+                    buf = processor.composite_overlay(buf, overlay)
+                else:
                     buf = processor.apply_burnins(
                         buf,
                         self.burnin_metadata,
                         self.burnin_config,
                     )
-                except Exception as e:
-                    logger.warning(f"Preview burn-in failed: {e}")
+            except Exception as e:
+                logger.warning(f"Preview burn-in failed: {e}")
+
+        if self.is_cancelled():
+            return None
+
+        channels = buf.spec().nchannels
+        q_format = _FORMATS_BY_CHANNELS.get(channels)
+        if q_format is None:
+            raise ValueError(f"Unsupported image channels: {channels}")
+        channel_order = _QT32_CHANNEL_ORDER.get(channels)
+        if channel_order is not None:
+            buf = oiio.ImageBufAlgo.channels(buf, channel_order)
+
+        # OIIO narrows to uint8 itself (clamped to [0, 1] and rounded) in its SIMD
+        # convert path, so no float copy of the pixels is made in Python.
+        spec = buf.spec()
+        image = buf.get_pixels(oiio.UINT8)
+        # Each stage above rebinds `buf`, so only the float pixels of the last
+        # stage are still alive; free them before Qt gets the uint8 copy.
+        del buf
+        if image is None or image.size == 0:
+            raise ValueError("Failed to extract preview pixels.")
+        # A no-op view for OIIO's usual (h, w, c) result; also normalizes flat buffers
+        image = image.reshape((spec.height, spec.width, spec.nchannels))
+
+        # Convert to QImage. QImage wraps the numpy buffer without copying, so it
+        # must be C-contiguous and the row stride has to come from the array.
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        q_image = QImage(image.data, width, height, image.strides[0], q_format)
+        # PySide releases the buffer together with the image data; holding the
+        # array on the wrapper as well keeps it alive while the image is cached.
+        q_image.ndarray = image
+        return q_image
+
+
+class PreviewThread(QThread):
+    """Long-lived thread that renders the most recent preview request.
+
+    Requests are latest-wins: submitting a job cancels the one in flight and
+    replaces any job still waiting, so scrubbing never queues stale previews.
+    Results carry the request id they were submitted with. Rendered images are
+    kept in a byte-bounded LRU cache so revisited frames skip the pipeline.
+    """
+
+    preview_ready = Signal(QImage, int)
+    error = Signal(str, int)
 
-            image = buf.get_pixels(oiio.FLOAT)
-            if image is None or image.size == 0:
-                raise ValueError("Failed to extract preview pixels.")
-            spec = buf.spec()
-            if image.ndim == 1:
-                image = image.reshape((spec.height, spec.width, spec.nchannels))
-
-            # Convert to uint8
-            if image.dtype != np.uint8:
-                image_f32 = image.astype(np.float32, copy=False)
-                image = np.clip(image_f32, 0.0, 1.0)
-                image = (image * np.float32(255.0)).astype(np.uint8)
-
-            # Convert to QImage
-            height, width = image.shape[:2]
-            # Handle different Qt versions - format access differs
-            # PySide6/PyQt6: QImage.Format.Format_RGB888
-            # PySide2/PyQt5: QImage.Format_RGB888
-            try:
-                # Try PySide6/PyQt6 style
-                rgb_format = getattr(QImage.Format, "Format_RGB888", None)
-                rgba_format = getattr(QImage.Format, "Format_RGBA8888", None)
-            except (AttributeError, TypeError):
-                # Try PySide2/PyQt5 style
-                rgb_format = getattr(QImage, "Format_RGB888", None)
-                rgba_format = getattr(QImage, "Format_RGBA8888", None)
-
-            # Fallback to direct attribute access if getattr failed
-            if rgb_format is None:
-                try:
-                    rgb_format = QImage.Format.Format_RGB888
-                except AttributeError:
-                    rgb_format = QImage.Format_RGB888
-
-            if rgba_format is None:
-                try:
-                    rgba_format = QImage.Format.Format_RGBA8888
-                except AttributeError:
-                    rgba_format = QImage.Format_RGBA8888
-
-            if image.shape[2] == 3:
-                # RGB
-                q_image = QImage(image.data, width, height, width * 3, rgb_format)
-            elif image.shape[2] == 4:
-                # RGBA
-                q_image = QImage(image.data, width, height, width * 4, rgba_format)
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        cache_bytes: int = _PREVIEW_CACHE_BYTES,
+    ) -> None:
+        """Initialize the preview thread.
+
+        Args:
+            parent: Parent QObject
+            cache_bytes: Approximate memory budget for cached images (0 disables)
+        """
+        super().__init__(parent)
+        self._condition = threading.Condition()
+        self._pending: Optional[tuple[int, PreviewWorker]] = None
+        self._current: Optional[PreviewWorker] = None
+        self._stopping = False
+        self._cache: OrderedDict[tuple, QImage] = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_limit = cache_bytes
+
+    def clear_cache(self) -> None:
+        """Drop all cached preview images."""
+        with self._condition:
+            self._cache.clear()
+            self._cache_bytes = 0
+
+    def _cache_lookup(self, key: Optional[tuple]) -> Optional[QImage]:
+        if key is None:
+            return None
+        with self._condition:
+            image = self._cache.get(key)
+            if image is not None:
+                self._cache.move_to_end(key)
+            return image
+
+    def _cache_store(self, key: Optional[tuple], image: QImage) -> None:
+        size = _image_bytes(image)
+        if key is None or size > self._cache_limit:
+            return
+        with self._condition:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._cache_bytes -= _image_bytes(previous)
+            self._cache[key] = image
+            self._cache_bytes += size
+            while self._cache_bytes > self._cache_limit:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= _image_bytes(evicted)
+
+    def submit(self, job: PreviewWorker, request_id: int) -> None:
+        """Queue a preview job, superseding any pending or running one.
+
+        Args:
+            job: Preview request to render
+            request_id: Id echoed back with the result
+        """
+        with self._condition:
+            if self._current is not None:
+                self._current.cancel()
+            self._pending = (request_id, job)
+            self._stopping = False
+            self._condition.notify()
+        if not self.isRunning():
+            self.start()
+
+    def stop(self, timeout_ms: Optional[int] = None) -> None:
+        """Cancel outstanding work and stop the thread.
+
+        A read already inside OIIO cannot be interrupted, so by default this
+        waits for it to return; the thread must not be destroyed while running.
+
+        Args:
+            timeout_ms: Maximum time to wait for the thread to exit (None waits until it does)
+        """
+        with self._condition:
+            self._stopping = True
+            self._pending = None
+            if self._current is not None:
+                self._current.cancel()
+            self._condition.notify()
+        if self.isRunning():
+            if timeout_ms is None:
+                self.wait()
             else:
-                raise ValueError(f"Unsupported image channels: {image.shape[2]}")
+                self.wait(timeout_ms)
 
-            # Create pixmap
-            pixmap = QPixmap.fromImage(q_image)
+    def run(self) -> None:
+        """Render submitted jobs until stop() is called."""
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                request_id, job = self._pending
+                self._pending = None
+                self._current = job
+
+            key = job.cache_key()
+            image = self._cache_lookup(key)
+            if image is not None:
+                self.preview_ready.emit(image, request_id)
+                with self._condition:
+                    self._current = None
+                continue
 
-            self.preview_ready.emit(pixmap)
-        except Exception as e:
-            self.error.emit(str(e))
+            try:
+                image = job.render()
+            except Exception as e:
+                if not job.is_cancelled():
+                    self.error.emit(str(e), request_id)
+            else:
+                if image is not None and not job.is_cancelled():
+                    self._cache_store(key, image)
+                    self.preview_ready.emit(image, request_id)
+            finally:
+                with self._condition:
+                    self._current = None
 
 
 class ZoomableScrollArea(QScrollArea):
@@ -192,9 +503,18 @@ class FullscreenPreviewWindow(QWidget):
         self.setWindowTitle(title)
         self.setMinimumSize(800, 600)
         self._pixmap = pixmap
+        # Halving pyramid of the source, built on demand while zooming out
+        self._mips: list[QPixmap] = [pixmap]
         self._zoom_factor = 1.0  # 1.0 = Original size
         self._is_panning = False
         self._last_mouse_pos = QPoint()
+        # (width, height, fast) of the pixmap currently shown
+        self._scaled_key: Optional[tuple[int, int, bool]] = None
+        # Wheel zoom renders fast frames; one smooth pass follows once zooming pauses
+        self._zoom_idle_timer = QTimer(self)
+        self._zoom_idle_timer.setSingleShot(True)
+        self._zoom_idle_timer.setInterval(100)
+        self._zoom_idle_timer.timeout.connect(self._finalize_smooth_scale)
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -269,8 +589,12 @@ class FullscreenPreviewWindow(QWidget):
         self._zoom_factor = min(w_scale, h_scale) * 0.95  # Leave a small margin
         self._update_image()
 
-    def _update_image(self) -> None:
-        """Update the displayed image based on current zoom factor."""
+    def _update_image(self, fast: bool = False) -> None:
+        """Update the displayed image based on current zoom factor.
+
+        Args:
+            fast: Use nearest-neighbour scaling for an interactive, transient frame
+        """
         if self._pixmap.isNull():
             self.image_label.setText("No image")
             return
@@ -282,18 +606,38 @@ class FullscreenPreviewWindow(QWidget):
         # If larger, we need to manually size the label to trigger scrollbars
         self.image_label.setFixedSize(new_width, new_height)
 
-        scaled = self._pixmap.scaled(
-            new_width,
-            new_height,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        self.image_label.setPixmap(scaled)
+        scaled_key = (new_width, new_height, fast)
+        if scaled_key != self._scaled_key:
+            source = self._mip_for_zoom(self._zoom_factor)
+            scaled = _fit_pixmap(source, QSize(new_width, new_height), fast=fast)
+            self.image_label.setPixmap(scaled)
+            self._scaled_key = scaled_key
 
         # Update labels
         self.res_label.setText(f"Resolution: {self._pixmap.width()} x {self._pixmap.height()}")
         self.zoom_label.setText(f"Zoom: {int(self._zoom_factor * 100)}%")
 
+    def _mip_for_zoom(self, zoom: float) -> QPixmap:
+        """Return the smallest pyramid level that is still at least ``zoom`` in size.
+
+        Resampling from a level at most twice the target keeps each zoom step
+        cheap, however far the user zooms out.
+        """
+        if zoom >= 1.0:
+            return self._pixmap
+        level = int(math.log2(1.0 / zoom))
+        while len(self._mips) <= level:
+            last = self._mips[-1]
+            if last.width() < _MIN_MIP_SIZE or last.height() < _MIN_MIP_SIZE:
+                break
+            half = QSize(max(1, last.width() // 2), max(1, last.height() // 2))
+            self._mips.append(last.scaled(half, _KEEP_ASPECT, _SMOOTH_TRANSFORM))
+        return self._mips[min(level, len(self._mips) - 1)]
+
+    def _finalize_smooth_scale(self) -> None:
+        """Replace the fast zoom frame with a smoothly scaled one."""
+        self._update_image(fast=False)
+
     def wheelEvent(self, event) -> None:
         """Handle mouse wheel for zooming."""
         # Calculate cursor position relative to the image
@@ -313,21 +657,28 @@ class FullscreenPreviewWindow(QWidget):
         # Clamp zoom: 1% to 1000%
         self._zoom_factor = max(0.01, min(self._zoom_factor, 10.0))
 
-        # Update image
-        self._update_image()
+        # Resizing the image and moving both scrollbars each request a repaint;
+        # suspend updates so the zoom step lands as a single paint.
+        self.setUpdatesEnabled(False)
+        try:
+            # Update image quickly; the idle timer restores smooth scaling
+            self._update_image(fast=True)
+            self._zoom_idle_timer.start()
 
-        # Adjust scrollbars to maintain position under mouse
-        if old_zoom > 0:
-            # Shift scrollbars
-            factor = self._zoom_factor / old_zoom
-            h_bar = self.scroll_area.horizontalScrollBar()
-            v_bar = self.scroll_area.verticalScrollBar()
+            # Adjust scrollbars to maintain position under mouse
+            if old_zoom > 0:
+                # Shift scrollbars
+                factor = self._zoom_factor / old_zoom
+                h_bar = self.scroll_area.horizontalScrollBar()
+                v_bar = self.scroll_area.verticalScrollBar()
 
-            new_h = int((h_bar.value() + viewport_pos.x()) * factor - viewport_pos.x())
-            new_v = int((v_bar.value() + viewport_pos.y()) * factor - viewport_pos.y())
+                new_h = int((h_bar.value() + viewport_pos.x()) * factor - viewport_pos.x())
+                new_v = int((v_bar.value() + viewport_pos.y()) * factor - viewport_pos.y())
 
-            h_bar.setValue(new_h)
-            v_bar.setValue(new_v)
+                h_bar.setValue(new_h)
+                v_bar.setValue(new_v)
+        finally:
+            self.setUpdatesEnabled(True)
 
         event.accept()
 
@@ -379,15 +730,34 @@ class FullscreenPreviewWindow(QWidget):
 class PreviewWidget(QWidget):
     """Widget for displaying image preview."""
 
+    # Emits the displayed pixmap itself (implicitly shared with the fullscreen
+    # window); receivers must copy() it before painting into it.
     thumbnail_requested = Signal(QPixmap)
 
     def __init__(self) -> None:
         """Initialize preview widget."""
         super().__init__()
+        self._label_style: Optional[str] = None
+        # Label size the displayed pixmap was last scaled for
+        self._scaled_size: Optional[QSize] = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(30)
+        self._resize_timer.timeout.connect(self._update_scaled_pixmap)
         self._setup_ui()
         self._original_pixmap: Optional[QPixmap] = None
-        self.worker: Optional[PreviewWorker] = None
-        self._active_workers: list[PreviewWorker] = []
+        self._request_id = 0
+        self._preview_thread = PreviewThread()
+        self._preview_thread.preview_ready.connect(self._on_preview_ready)
+        self._preview_thread.error.connect(self._on_preview_error)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+        # A QThread destroyed while running aborts the process, so stop it with the
+        # widget too; embedded hosts and scripts may never emit aboutToQuit. The
+        # lambda holds the thread itself, not the widget wrapper being torn down.
+        thread = self._preview_thread
+        self.destroyed.connect(lambda *_: thread.stop())
         self.fullscreen_win: Optional[FullscreenPreviewWindow] = None
 
     def _setup_ui(self) -> None:
@@ -404,14 +774,7 @@ class PreviewWidget(QWidget):
         self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.preview_label.setMinimumSize(240, 180)
         self.preview_label.setMaximumHeight(360)
-        self.preview_label.setStyleSheet("""
-            QLabel {
-                background-color: #2b2b2b;
-                color: #888;
-                border: 1px solid #444;
-                border-radius: 4px;
-            }
-        """)
+        self._set_label_style(_LABEL_STYLE_IDLE)
         self.preview_label.setScaledContents(False)
         container_layout.addWidget(self.preview_label)
 
@@ -449,7 +812,8 @@ class PreviewWidget(QWidget):
     def resizeEvent(self, event) -> None:
         """Scale preview pixmap to the current label size."""
         super().resizeEvent(event)
-        self._update_scaled_pixmap()
+        # Coalesce bursts of resize events (e.g. window drags) into one rescale
+        self._resize_timer.start()
 
         # Position expand button
         btn_x = self.container.width() - self.expand_btn.width() - 8
@@ -458,6 +822,13 @@ class PreviewWidget(QWidget):
         export_x = btn_x - self.export_btn.width() - 6
         self.export_btn.move(export_x, btn_y)
 
+    def _set_label_style(self, style: str) -> None:
+        """Apply a preview label stylesheet, skipping the re-polish if unchanged."""
+        if style is self._label_style:
+            return
+        self._label_style = style
+        self.preview_label.setStyleSheet(style)
+
     def load_preview(
         self,
         file_path: Path,
@@ -481,35 +852,14 @@ class PreviewWidget(QWidget):
             burnin_metadata: Optional burn-in metadata for token replacement
             preview_scale: Scaling factor for preview performance
         """
-        # Safety: Never terminate() a thread busy with I/O (like OIIO).
-        # Instead, disconnect signals so its results are ignored, and let it finish.
-        if self.worker and self.worker.isRunning():
-            try:
-                self.worker.preview_ready.disconnect(self._on_preview_ready)
-                self.worker.error.disconnect(self._on_preview_error)
-            except (RuntimeError, TypeError):
-                # Signals might already be disconnected or worker deleted
-                pass
-
-            # Keep a reference alive until it finishes to avoid "QThread: Destroyed while still running"
-            if self.worker not in self._active_workers:
-                self._active_workers.append(self.worker)
-
-            self.worker.finished.connect(self._on_worker_finished)
-            self.worker.finished.connect(self.worker.deleteLater)
-
         self._original_pixmap = None
         self.preview_label.setText("Loading preview...")
-        self.preview_label.setStyleSheet("""
-            QLabel {
-                background-color: #2b2b2b;
-                color: #888;
-                border: 1px solid #444;
-                border-radius: 4px;
-            }
-        """)
+        self._set_label_style(_LABEL_STYLE_IDLE)
 
-        self.worker = PreviewWorker(
+        # The persistent preview thread cancels whatever it is rendering; results
+        # from superseded requests are dropped by request id.
+        self._request_id += 1
+        job = PreviewWorker(
             file_path,
             color_space,
             input_space=input_space,
@@ -519,23 +869,24 @@ class PreviewWidget(QWidget):
             burnin_metadata=burnin_metadata,
             preview_scale=preview_scale,
         )
-        self.worker.preview_ready.connect(self._on_preview_ready)
-        self.worker.error.connect(self._on_preview_error)
-        self.worker.finished.connect(self._on_worker_finished)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.worker.start()
-
-    def _on_worker_finished(self) -> None:
-        """Cleanup worker reference when finished."""
-        worker = self.sender()
-        if isinstance(worker, PreviewWorker) and worker in self._active_workers:
-            self._active_workers.remove(worker)
-        if worker == self.worker:
-            self.worker = None
-
-    def _on_preview_ready(self, pixmap: QPixmap) -> None:
+        self._preview_thread.submit(job, self._request_id)
+
+    def shutdown(self) -> None:
+        """Stop the background preview thread."""
+        self._preview_thread.stop()
+
+    def closeEvent(self, event) -> None:
+        """Stop the preview thread when the widget is closed."""
+        self.shutdown()
+        super().closeEvent(event)
+
+    def _on_preview_ready(self, image: QImage, request_id: int) -> None:
         """Handle preview ready."""
-        self._original_pixmap = pixmap
+        if request_id != self._request_id:
+            return
+        # Pixmaps are created on the GUI thread only
+        self._original_pixmap = QPixmap.fromImage(image)
+        self._scaled_size = None
         self.preview_label.setText("")
         self._update_scaled_pixmap()
         self.expand_btn.show()
@@ -550,42 +901,32 @@ class PreviewWidget(QWidget):
         self.fullscreen_win.setWindowModality(Qt.WindowModality.NonModal)
         self.fullscreen_win.show()
 
-    def _on_preview_error(self, error: str) -> None:
+    def _on_preview_error(self, error: str, request_id: int) -> None:
         """Handle preview error."""
+        if request_id != self._request_id:
+            return
         self._original_pixmap = None
         self.preview_label.setText(f"Preview error:\n{error}")
         self.expand_btn.hide()
         self.export_btn.hide()
-        self.preview_label.setStyleSheet("""
-            QLabel {
-                background-color: #2b2b2b;
-                color: #f44336;
-                border: 1px solid #444;
-                border-radius: 4px;
-            }
-        """)
+        self._set_label_style(_LABEL_STYLE_ERROR)
 
     def clear_preview(self) -> None:
         """Clear the preview."""
+        # Invalidate any preview still in flight so it cannot repopulate the label
+        self._request_id += 1
         self._original_pixmap = None
         self.preview_label.clear()
         self.preview_label.setText("No preview")
         self.expand_btn.hide()
         self.export_btn.hide()
-        self.preview_label.setStyleSheet("""
-            QLabel {
-                background-color: #2b2b2b;
-                color: #888;
-                border: 1px solid #444;
-                border-radius: 4px;
-            }
-        """)
+        self._set_label_style(_LABEL_STYLE_IDLE)
 
     def _request_thumbnail_export(self) -> None:
         """Emit request to export a preview thumbnail."""
         if not self._original_pixmap:
             return
-        self.thumbnail_requested.emit(self._original_pixmap.copy())
+        self.thumbnail_requested.emit(self._original_pixmap)
 
     def _update_scaled_pixmap(self) -> None:
         """Scale stored pixmap to the label size, keeping aspect ratio."""
@@ -595,10 +936,9 @@ class PreviewWidget(QWidget):
         target_size = self.preview_label.size()
         if target_size.width() <= 0 or target_size.height() <= 0:
             return
+        if target_size == self._scaled_size:
+            return
 
-        scaled = self._original_pixmap.scaled(
-            target_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
+        scaled = _fit_pixmap(self._original_pixmap, target_size, fast_mild_downscale=True)
         self.preview_label.setPixmap(scaled)
+        self._scaled_size = target_size
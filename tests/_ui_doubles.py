@@ -0,0 +1,86 @@
+"""Lightweight stand-ins for Qt widgets, signals, workers and sequences used by UI tests."""
+
+from pathlib import Path
+
+
+class DummySignal:
+    __slots__ = ("connected",)
+
+    def __init__(self) -> None:
+        self.connected = []
+
+    def connect(self, func) -> None:
+        self.connected.append(func)
+
+
+class DummyWorker:
+    __slots__ = ("file_path", "parent", "file_info_ready", "error_occurred", "started", "_running")
+
+    def __init__(self, file_path: Path, parent=None) -> None:
+        self.file_path = file_path
+        self.parent = parent
+        self.file_info_ready = DummySignal()
+        self.error_occurred = DummySignal()
+        self.started = False
+        self._running = False
+
+    def isRunning(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        self.started = True
+
+
+class DummyValue:
+    __slots__ = ("_value",)
+
+    def __init__(self, value) -> None:
+        self._value = value
+
+    def value(self):
+        return self._value
+
+
+class DummyCheck:
+    __slots__ = ("_checked",)
+
+    def __init__(self, checked: bool) -> None:
+        self._checked = checked
+
+    def isChecked(self) -> bool:
+        return self._checked
+
+
+class DummyCombo:
+    __slots__ = ("_text",)
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+
+    def currentText(self) -> str:
+        return self._text
+
+
+class DummyPreviewWidget:
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def load_preview(self, *args, **kwargs) -> None:
+        self.calls.append((args, kwargs))
+
+
+class MockSequence:
+    """Stand-in for FrameSequence that never touches the filesystem."""
+
+    __slots__ = ("frame_numbers",)
+
+    def __init__(self, frame_numbers) -> None:
+        self.frame_numbers = frame_numbers
+
+    def __len__(self) -> int:
+        return len(self.frame_numbers)
+
+    def get_file_path(self, frame: int) -> Path:
+        return Path(f"render.{frame:04d}.exr")
@@ -0,0 +1,17 @@
+"""Location of the sample renders used by the verify_* scripts."""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+
+def sample_data_root() -> Optional[Path]:
+    """RENDERKIT_TEST_DATA as a Path, or None when unset or its drive is not mounted."""
+    data_root = os.environ.get("RENDERKIT_TEST_DATA")
+    if not data_root:
+        return None
+    root = Path(data_root)
+    # Check the drive root first; probing deep paths on a missing mapped drive can stall
+    if root.anchor and not os.path.isdir(root.anchor):
+        return None
+    return root
@@ -1,20 +1,26 @@
 import OpenImageIO as oiio
 
 path = r"G:\Projects\Data_folder\render\Canyon_Run\sq001\sh001\work\fx\render\CanRun_sh001_fx_v063\SH030_karma_all_render\SH030_karma_all_render.1001.exr"
-buf = oiio.ImageBuf(path)
-if buf.has_error:
-    print(f"Error reading: {buf.geterror()}")
+inp = oiio.ImageInput.open(path)
+if inp is None:
+    print(f"Error reading: {oiio.geterror()}")
 else:
-    print(f"Subimages (Parts): {buf.nsubimages}")
-    for i in range(buf.nsubimages):
-        sub_buf = oiio.ImageBuf(path, i, 0)  # Initialize with subimage i
-        spec = sub_buf.spec()
+    # Walk the part headers through a single open file; no pixels are decoded
+    try:
+        specs = []
+        while inp.seek_subimage(len(specs), 0):
+            specs.append(inp.spec())
+    finally:
+        inp.close()
+
+    print(f"Subimages (Parts): {len(specs)}")
+    for i, spec in enumerate(specs):
         print(
             f"Part {i} ('{spec.getattribute('name') or 'unnamed'}') Channels: {spec.channelnames}"
         )
 
     # Original logic (checking if grouped channels exist in part 0)
-    spec = buf.spec()
+    spec = specs[0]
     layers = set()
     for name in spec.channelnames:
         if "." in name:
@@ -0,0 +1,193 @@
+"""Shared pytest configuration."""
+
+from typing import Any
+
+import pytest
+
+from tests._ui_doubles import MockSequence
+
+# Pay the OIIO/OCIO and Qt import cost at collection, not inside the first test that needs it
+try:
+    import renderkit.processing.color_space  # noqa: F401
+    import renderkit.ui.main_window  # noqa: F401
+except ImportError:
+    pass
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _disable_stylesheet():
+    """Skip QSS parsing for every window; session scoped so shared windows see it too."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("RENDERKIT_DISABLE_STYLESHEET", "1")
+        yield
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The process-wide QApplication, created once and never quit."""
+    from renderkit.ui.qt_compat import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(autouse=True)
+def _stub_file_info_worker(monkeypatch):
+    """Keep the async metadata worker from starting threads on test fixtures."""
+    from renderkit.ui.file_info_worker import FileInfoWorker
+
+    monkeypatch.setattr(FileInfoWorker, "start", lambda self: None)
+
+
+class MemorySettings:
+    """Dict-backed stand-in for the QSettings calls the main window makes."""
+
+    def __init__(self):
+        self._values = {}
+
+    def value(self, key, default=None, type=None):
+        return self._values.get(key, default)
+
+    def setValue(self, key, value):
+        self._values[key] = value
+
+    def remove(self, key):
+        self._values.pop(key, None)
+
+    def sync(self):
+        pass
+
+
+@pytest.fixture
+def patch_sequence_detector(monkeypatch):
+    """Route SequenceDetector.detect_sequence to MockSequence objects.
+
+    Call the returned function with a mapping of pattern substrings to frame
+    numbers; patterns matching no key detect a single frame 1.
+    """
+
+    from renderkit.core.sequence import SequenceDetector
+
+    def _apply(frames_by_key):
+        def _detect(pattern):
+            for key, frames in frames_by_key.items():
+                if key in pattern:
+                    return MockSequence(frames)
+            return MockSequence([1])
+
+        monkeypatch.setattr(SequenceDetector, "detect_sequence", _detect)
+
+    return _apply
+
+
+@pytest.fixture(autouse=True)
+def _mute_dialogs(monkeypatch):
+    """Replace modal message boxes and file dialogs so no test can block on one."""
+    from renderkit.ui.qt_compat import QFileDialog, QMessageBox
+
+    def _no_button(*args, **kwargs):
+        return QMessageBox.StandardButton.NoButton
+
+    for name in ("warning", "information", "critical", "question"):
+        monkeypatch.setattr(QMessageBox, name, _no_button)
+    monkeypatch.setattr(QFileDialog, "getOpenFileName", lambda *args, **kwargs: ("", ""))
+    monkeypatch.setattr(QFileDialog, "getSaveFileName", lambda *args, **kwargs: ("", ""))
+
+
+@pytest.fixture(scope="module")
+def _module_main_window(qapp):
+    """One ModernMainWindow per test module; building the widget tree dominates UI tests."""
+    from renderkit.ui.main_window import ModernMainWindow
+
+    window = ModernMainWindow()
+    yield window
+    window.close()
+    window.deleteLater()
+
+
+def _control_state(window) -> list[tuple[Any, str, str, Any]]:
+    """(widget, getter, setter, value) for every user-editable control in ``window``."""
+    from renderkit.ui.qt_compat import (
+        QCheckBox,
+        QComboBox,
+        QDoubleSpinBox,
+        QLineEdit,
+        QSlider,
+        QSpinBox,
+    )
+
+    accessors = (
+        (QCheckBox, "isChecked", "setChecked"),
+        (QComboBox, "currentIndex", "setCurrentIndex"),
+        (QSpinBox, "value", "setValue"),
+        (QDoubleSpinBox, "value", "setValue"),
+        (QSlider, "value", "setValue"),
+        (QLineEdit, "text", "setText"),
+    )
+    state = []
+    for widget_type, getter, setter in accessors:
+        for widget in window.findChildren(widget_type):
+            # Editors owned by combos and spin boxes follow their owner's value
+            if isinstance(widget, QLineEdit) and isinstance(
+                widget.parent(), (QComboBox, QSpinBox, QDoubleSpinBox)
+            ):
+                continue
+            state.append((widget, getter, setter, getattr(widget, getter)()))
+    return state
+
+
+@pytest.fixture(scope="module")
+def _main_window_defaults(_module_main_window):
+    """Control values of the shared window as built, captured before any test runs."""
+    return _control_state(_module_main_window)
+
+
+@pytest.fixture
+def main_window(_module_main_window, _main_window_defaults):
+    """The module's shared main window, with its controls and preview reset to their defaults.
+
+    Only controls whose value changed are set back, so untouched widgets emit no signals.
+    """
+    window = _module_main_window
+    for widget, getter, setter, default in _main_window_defaults:
+        if getattr(widget, getter)() != default:
+            getattr(widget, setter)(default)
+    window.input_pattern_combo.lineEdit().setText("")
+    window.output_path_edit.setText("")
+    window._on_pattern_changed()
+
+    preview = window.preview_widget
+    preview.shutdown()
+    preview._preview_thread.clear_cache()
+    preview.clear_preview()
+    preview._request_id = 0
+    return window
+
+
+@pytest.fixture
+def memory_settings(main_window, monkeypatch):
+    """Back the shared main window with in-memory settings for one test.
+
+    The window is built once per module, so its settings object is swapped on
+    the instance rather than patching the QSettings class.
+    """
+    settings = MemorySettings()
+    monkeypatch.setattr(main_window, "settings", settings)
+    return settings
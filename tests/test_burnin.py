@@ -49,3 +49,34 @@ def test_apply_burnins_logic():
     # We just want to ensure it doesn't crash
     result_buf = processor.apply_burnins(buf, metadata, config)
     assert result_buf is buf
+
+
+@pytest.mark.parametrize(
+    ("channels", "alpha"),
+    [(3, None), (4, 1.0), (4, 0.25)],
+    ids=["rgb", "rgba-opaque", "rgba-translucent"],
+)
+def test_burnin_overlay_matches_direct_burnin(channels, alpha):
+    """Compositing a cached overlay should match the colour of burn-ins drawn in place."""
+    oiio = pytest.importorskip("OpenImageIO")
+    import numpy as np
+
+    processor = BurnInProcessor()
+    config = BurnInConfig(
+        elements=[BurnInElement(text_template="Frame {frame}", x=0, y=10)],
+        background_opacity=40,
+    )
+    metadata = {"frame": 1001}
+    base = oiio.ImageBuf(oiio.ImageSpec(160, 90, channels, oiio.FLOAT))
+    oiio.ImageBufAlgo.fill(base, (0.5,) * 3 + (() if alpha is None else (alpha,)))
+
+    direct = processor.apply_burnins(base.copy(), metadata, config)
+    overlay = processor.render_overlay(160, 90, metadata, config)
+    composited = processor.composite_overlay(base, overlay)
+
+    assert composited.spec().nchannels == channels
+    pixels = composited.get_pixels(oiio.FLOAT)
+    np.testing.assert_allclose(pixels[..., :3], direct.get_pixels(oiio.FLOAT)[..., :3], atol=1e-5)
+    if alpha is not None:
+        # The burn-in is drawn into colour only; the source alpha passes through
+        np.testing.assert_array_equal(pixels[..., 3], base.get_pixels(oiio.FLOAT)[..., 3])
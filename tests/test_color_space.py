@@ -1,5 +1,8 @@
 """Tests for color space conversion."""
 
+import functools
+from typing import Optional
+
 import numpy as np
 import pytest
 
@@ -15,10 +18,29 @@ try:
 except ImportError:
     oiio = None
 
+pytestmark = pytest.mark.skipif(oiio is None, reason="OpenImageIO not available")
+
+
+def _pixel(*values: float) -> np.ndarray:
+    """Read-only 1x1 float32 test image; conversions must not write to their input."""
+    pixels = np.array([[values]], dtype=np.float32)
+    pixels.setflags(write=False)
+    return pixels
+
+
+_LINEAR_RGB = _pixel(0.0, 0.5, 1.0)
+_GREY = _pixel(0.5, 0.5, 0.5)
+_HDR = _pixel(10.0, 5.0, 2.0)
+_ARBITRARY = _pixel(0.1, 0.5, 0.9)
+
+
+@functools.cache
+def _converter(preset: ColorSpacePreset) -> ColorSpaceConverter:
+    """Shared converter per preset; errors surface at conversion, not construction."""
+    return ColorSpaceConverter(preset)
+
 
 def _make_buf(pixels: np.ndarray):
-    if oiio is None:
-        pytest.skip("OpenImageIO not available")
     h, w, c = pixels.shape
     spec = oiio.ImageSpec(w, h, c, oiio.FLOAT)
     buf = oiio.ImageBuf(spec)
@@ -27,10 +49,12 @@ def _make_buf(pixels: np.ndarray):
 
 
 def _buf_to_array(buf):
-    pixels = buf.get_pixels(oiio.FLOAT)
+    # Read in the buffer's own format so float buffers skip OIIO's convert pass
+    spec = buf.spec()
+    pixels = buf.get_pixels(spec.format)
     if pixels is None or pixels.size == 0:
         return None
-    spec = buf.spec()
+    pixels = pixels.astype(np.float32, copy=False)
     if pixels.ndim == 1:
         return pixels.reshape((spec.height, spec.width, spec.nchannels))
     return pixels
@@ -41,11 +65,10 @@ class TestColorSpaceConverter:
 
     def test_linear_to_srgb_conversion(self) -> None:
         """Test linear to sRGB conversion."""
-        converter = ColorSpaceConverter(ColorSpacePreset.LINEAR_TO_SRGB)
+        converter = _converter(ColorSpacePreset.LINEAR_TO_SRGB)
 
         # Test with linear values
-        linear_image = np.array([[[0.0, 0.5, 1.0]]], dtype=np.float32)
-        buf = _make_buf(linear_image)
+        buf = _make_buf(_LINEAR_RGB)
         srgb_buf = converter.convert_buf(buf)
         srgb_image = _buf_to_array(srgb_buf)
 
@@ -55,22 +78,21 @@ class TestColorSpaceConverter:
 
     def test_no_conversion(self) -> None:
         """Test no conversion strategy."""
-        converter = ColorSpaceConverter(ColorSpacePreset.NO_CONVERSION)
+        converter = _converter(ColorSpacePreset.NO_CONVERSION)
 
-        test_image = np.array([[[0.5, 0.5, 0.5]]], dtype=np.float32)
-        buf = _make_buf(test_image)
+        buf = _make_buf(_GREY)
         result_buf = converter.convert_buf(buf)
         result = _buf_to_array(result_buf)
 
-        np.testing.assert_array_equal(test_image, result)
+        assert result.dtype == _GREY.dtype
+        assert np.array_equal(_GREY, result)
 
     def test_hdr_tone_mapping(self) -> None:
         """Test that HDR values are tone mapped."""
-        converter = ColorSpaceConverter(ColorSpacePreset.LINEAR_TO_SRGB)
+        converter = _converter(ColorSpacePreset.LINEAR_TO_SRGB)
 
         # HDR values > 1.0
-        hdr_image = np.array([[[10.0, 5.0, 2.0]]], dtype=np.float32)
-        buf = _make_buf(hdr_image)
+        buf = _make_buf(_HDR)
         result_buf = converter.convert_buf(buf)
         result = _buf_to_array(result_buf)
 
@@ -78,43 +100,73 @@ class TestColorSpaceConverter:
         assert np.all(result >= 0.0)
         assert np.all(result <= 1.0)
 
-    def test_invalid_preset(self) -> None:
+    @pytest.mark.parametrize("preset", list(ColorSpacePreset), ids=lambda preset: preset.value)
+    def test_invalid_preset(self, preset: ColorSpacePreset) -> None:
         """Test error with invalid preset."""
         # This would require adding an invalid preset to the enum
         # For now, just test that valid presets work
-        for preset in ColorSpacePreset:
-            converter = ColorSpaceConverter(preset)
-            test_image = np.array([[[0.5, 0.5, 0.5]]], dtype=np.float32)
-            if preset == ColorSpacePreset.OCIO_CONVERSION:
-                with pytest.raises(ColorSpaceError):
-                    converter.convert_buf(_make_buf(test_image))
-            elif preset == ColorSpacePreset.LINEAR_TO_REC709:
-                if not _has_oiio_colorspace_candidates(
-                    [
-                        "Rec709",
-                        "Rec.709",
-                        "rec709",
-                        "BT.709",
-                        "bt709",
-                        "Output - Rec.709",
-                        "Output - Rec709",
-                    ]
-                ):
-                    pytest.skip("Rec.709 colorspace not available in OCIO config.")
-                result_buf = converter.convert_buf(_make_buf(test_image))
-                result = _buf_to_array(result_buf)
-                assert result.shape == test_image.shape
-            else:
-                result_buf = converter.convert_buf(_make_buf(test_image))
-                result = _buf_to_array(result_buf)
-                assert result.shape == test_image.shape
+        converter = _converter(preset)
+        if preset == ColorSpacePreset.OCIO_CONVERSION:
+            with pytest.raises(ColorSpaceError):
+                converter.convert_buf(_make_buf(_GREY))
+            return
+
+        if preset == ColorSpacePreset.LINEAR_TO_REC709 and not _has_oiio_colorspace_candidates(
+            [
+                "Rec709",
+                "Rec.709",
+                "rec709",
+                "BT.709",
+                "bt709",
+                "Output - Rec.709",
+                "Output - Rec709",
+            ]
+        ):
+            pytest.skip("Rec.709 colorspace not available in OCIO config.")
+        result_buf = converter.convert_buf(_make_buf(_GREY))
+        result = _buf_to_array(result_buf)
+        assert result.shape == _GREY.shape
 
     def test_ocio_requires_input_space(self) -> None:
         """Test OCIO conversion requires an input space."""
-        converter = ColorSpaceConverter(ColorSpacePreset.OCIO_CONVERSION)
-        test_image = np.array([[[0.5, 0.5, 0.5]]], dtype=np.float32)
+        converter = _converter(ColorSpacePreset.OCIO_CONVERSION)
         with pytest.raises(ColorSpaceError):
-            converter.convert_buf(_make_buf(test_image))
+            converter.convert_buf(_make_buf(_GREY))
+
+    def test_ocio_identity_conversion_is_passthrough(self) -> None:
+        """Test OCIO conversion into the output space returns the pixels unchanged."""
+        pytest.importorskip("PyOpenColorIO")
+        converter = _converter(ColorSpacePreset.OCIO_CONVERSION)
+        output_space = converter._strategy._resolve_output_space()
+
+        result_buf = converter.convert_buf(_make_buf(_ARBITRARY), input_space=output_space)
+
+        result = _buf_to_array(result_buf)
+        assert result.dtype == _ARBITRARY.dtype
+        assert np.array_equal(_ARBITRARY, result)
+
+    def test_ocio_input_space_resolution_is_memoized(self) -> None:
+        """Test OCIO input space names are resolved against the config only once."""
+        pytest.importorskip("PyOpenColorIO")
+        converter = ColorSpaceConverter(ColorSpacePreset.OCIO_CONVERSION)
+        strategy = converter._strategy
+        calls = []
+        get_names = strategy.config.getColorSpaceNames
+
+        class _CountingConfig:
+            def __getattr__(self, name):
+                return getattr(get_names.__self__, name)
+
+            def getColorSpaceNames(self):
+                calls.append(1)
+                return get_names()
+
+        strategy.config = _CountingConfig()
+        first = strategy._resolve_input_space("scene_linear")
+        second = strategy._resolve_input_space("scene_linear")
+
+        assert first == second
+        assert len(calls) == 1
 
 
 class TestNoConversionStrategy:
@@ -124,31 +176,39 @@ class TestNoConversionStrategy:
         """Test that image passes through unchanged."""
         strategy = NoConversionStrategy()
 
-        test_image = np.array([[[0.1, 0.5, 0.9]]], dtype=np.float32)
-        buf = _make_buf(test_image)
+        buf = _make_buf(_ARBITRARY)
         result_buf = strategy.convert_buf(buf)
         result = _buf_to_array(result_buf)
 
-        np.testing.assert_array_equal(test_image, result)
+        assert result.dtype == _ARBITRARY.dtype
+        assert np.array_equal(_ARBITRARY, result)
 
 
-def _has_oiio_colorspace_candidates(candidates: list[str]) -> bool:
-    try:
-        import OpenImageIO as oiio
-    except ImportError:
-        return False
+@functools.lru_cache(maxsize=1)
+def _oiio_colorspace_index() -> Optional[tuple[frozenset[str], frozenset[str]]]:
+    """Lowered and normalized OIIO color space names, parsed from the config once."""
+    if oiio is None:
+        return None
 
     try:
-        config = oiio.ColorConfig()
-        names = config.getColorSpaceNames()
+        names = oiio.ColorConfig().getColorSpaceNames()
     except Exception:
-        return False
+        return None
 
     if not names:
+        return None
+
+    lowered = frozenset(name.lower() for name in names)
+    normalized = frozenset(name.replace("-", "_").replace(" ", "_") for name in lowered)
+    return lowered, normalized
+
+
+def _has_oiio_colorspace_candidates(candidates: list[str]) -> bool:
+    index = _oiio_colorspace_index()
+    if index is None:
         return False
 
-    lowered = {name.lower() for name in names}
-    normalized = {name.replace("-", "_").replace(" ", "_") for name in lowered}
+    lowered, normalized = index
     for candidate in candidates:
         key = candidate.lower()
         if key in lowered:
@@ -6,133 +6,97 @@ import pytest
 from renderkit.io.image_reader import OIIOReader
 
 
-def test_exr_metadata_fps_detection():
+@pytest.fixture
+def reader():
+    """Fresh reader per case, so no file-info cache carries over between cases."""
+    return OIIOReader()
+
+
+@pytest.fixture
+def spec_metadata():
+    """Patch OIIO so every ImageBuf spec reports the yielded metadata dict."""
+    metadata = {}
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("OpenImageIO.ImageBuf") as mock_buf_class,
+    ):
+        mock_buf = mock_buf_class.return_value
+        mock_buf.has_error = False
+        mock_buf.spec.return_value.getattribute.side_effect = metadata.get
+        yield metadata
+
+
+@pytest.mark.parametrize(
+    ("metadata", "expected"),
+    [
+        # Standard framesPerSecond (Rational)
+        ({"framesPerSecond": (24, 1)}, 24.0),
+        # Arnold-style fps (Float)
+        ({"arnold/fps": 23.976}, 23.976),
+        # Karma-style fps (Float)
+        ({"exr/FramesPerSecond": 24.0}, 24.0),
+        # Rational as tuple
+        ({"fps": (30000, 1001)}, pytest.approx(29.97, abs=0.01)),
+        # String metadata (float)
+        ({"exr/FramesPerSecond": "24.0"}, 24.0),
+        # Bytes metadata
+        ({"fps": b"23.976"}, 23.976),
+        # Rational string
+        ({"framesPerSecond": "24000/1001"}, pytest.approx(23.976, abs=0.001)),
+        # Invalid string
+        ({"fps": "invalid"}, None),
+    ],
+)
+def test_exr_metadata_fps_detection(reader, spec_metadata, metadata, expected):
     """Test that OIIOReader correctly extracts FPS from various metadata keys."""
-    reader = OIIOReader()
-    mock_path = Path("test.exr")
-
-    with patch("pathlib.Path.exists", return_value=True):
-        with patch("OpenImageIO.ImageBuf") as mock_buf_class:
-            mock_buf = mock_buf_class.return_value
-            mock_buf.has_error = False
-            mock_spec = mock_buf.spec.return_value
-
-            # Dictionary to store our mock metadata
-            metadata = {}
-            mock_spec.getattribute.side_effect = lambda key: metadata.get(key)
-
-            # Case 1: Standard framesPerSecond (Rational)
-            metadata.clear()
-            metadata["framesPerSecond"] = (24, 1)
-
-            fps = reader.get_metadata_fps(mock_path)
-            assert fps == 24.0
-
-            # Case 2: Arnold-style fps (Float)
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["arnold/fps"] = 23.976
-            fps = reader.get_metadata_fps(mock_path)
-            assert fps == 23.976
-
-            # Case 3: Karma-style fps (Float)
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["exr/FramesPerSecond"] = 24.0
-            fps = reader.get_metadata_fps(mock_path)
-            assert fps == 24.0
-
-            # Case 4: Rational as tuple
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["fps"] = (30000, 1001)
-            fps = reader.get_metadata_fps(mock_path)
-            assert abs(fps - 29.97) < 0.01
-
-            # Case 5: String metadata (float)
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["exr/FramesPerSecond"] = "24.0"
-            fps = reader.get_metadata_fps(mock_path)
-            assert fps == 24.0
-
-            # Case 6: Bytes metadata
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["fps"] = b"23.976"
-            fps = reader.get_metadata_fps(mock_path)
-            assert fps == 23.976
-
-            # Case 7: Case-insensitive match (Note: OIIO keys are case sensitive in implementation,
-            # but our Reader uses constants which should match the typical case)
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["exr/FramesPerSecond"] = 24.0
-            fps = reader.get_metadata_fps(mock_path)
-            assert fps == 24.0
-
-            # Case 8: Rational string
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["framesPerSecond"] = "24000/1001"
-            fps = reader.get_metadata_fps(mock_path)
-            assert abs(fps - 23.976) < 0.001
-
-            # Case 9: Invalid string
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["fps"] = "invalid"
-            fps = reader.get_metadata_fps(mock_path)
-            assert fps is None
-
-
-def test_exr_metadata_color_space_detection():
+    spec_metadata.update(metadata)
+
+    assert reader.get_metadata_fps(Path("test.exr")) == expected
+
+
+@pytest.mark.parametrize(
+    ("metadata", "expected"),
+    [
+        ({"exr/oiio:ColorSpace": "ACES - ACEScg"}, "ACES - ACEScg"),
+        ({"colorSpace": "Linear"}, "Linear"),
+        ({"interchange/color_space": "Rec.709"}, "Rec.709"),
+        ({"oiio:ColorSpace": "ACEScg"}, "ACEScg"),
+        ({"colorSpace": b"sRGB"}, "sRGB"),
+    ],
+)
+def test_exr_metadata_color_space_detection(reader, spec_metadata, metadata, expected):
     """Test that OIIOReader correctly extracts Color Space from various metadata keys."""
-    reader = OIIOReader()
-    mock_path = Path("test.exr")
-
-    with patch("pathlib.Path.exists", return_value=True):
-        with patch("OpenImageIO.ImageBuf") as mock_buf_class:
-            mock_buf = mock_buf_class.return_value
-            mock_buf.has_error = False
-            mock_spec = mock_buf.spec.return_value
-
-            metadata = {}
-            mock_spec.getattribute.side_effect = lambda key: metadata.get(key)
-
-            # Case 1: Standard exr/oiio:ColorSpace
-            metadata.clear()
-            metadata["exr/oiio:ColorSpace"] = "ACES - ACEScg"
-            cs = reader.get_metadata_color_space(mock_path)
-            assert cs == "ACES - ACEScg"
-
-            # Case 2: colorSpace
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["colorSpace"] = "Linear"
-            cs = reader.get_metadata_color_space(mock_path)
-            assert cs == "Linear"
-
-            # Case 3: interchange/color_space
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["interchange/color_space"] = "Rec.709"
-            cs = reader.get_metadata_color_space(mock_path)
-            assert cs == "Rec.709"
-
-            # Case 4: OIIO key match
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["oiio:ColorSpace"] = "ACEScg"
-            cs = reader.get_metadata_color_space(mock_path)
-            assert cs == "ACEScg"
-
-            # Case 5: Bytes
-            reader._file_info_cache.clear()
-            metadata.clear()
-            metadata["colorSpace"] = b"sRGB"
-            cs = reader.get_metadata_color_space(mock_path)
-            assert cs == "sRGB"
+    spec_metadata.update(metadata)
+
+    assert reader.get_metadata_color_space(Path("test.exr")) == expected
+
+
+def test_layer_subimage_lookup_reads_part_headers(reader, tmp_path):
+    """Layers living in later EXR parts should resolve to their subimage index."""
+    oiio = pytest.importorskip("OpenImageIO")
+    from renderkit.io import image_reader
+
+    path = tmp_path / "multipart.1001.exr"
+    specs = []
+    for name, channels in (("rgba", ("R", "G", "B")), ("diffuse", ("diffuse.R", "diffuse.G"))):
+        spec = oiio.ImageSpec(4, 4, len(channels), oiio.HALF)
+        spec.channelnames = channels
+        spec.attribute("name", name)
+        specs.append(spec)
+    out = oiio.ImageOutput.create(str(path))
+    assert out.open(str(path), specs)
+    for i, spec in enumerate(specs):
+        if i:
+            assert out.open(str(path), spec, "AppendSubimage")
+        assert out.write_image(oiio.ImageBuf(spec).get_pixels(oiio.HALF))
+    out.close()
+
+    image_reader._SUBIMAGE_INDEX_CACHE.clear()
+
+    assert reader._scan_subimage_index(path, "diffuse", oiio) == 1
+    assert reader._scan_subimage_index(path, "missing", oiio) == 0
+    with patch.object(reader, "_find_subimage_index", side_effect=AssertionError):
+        assert reader._scan_subimage_index(path, "diffuse", oiio) == 1
 
 
 if __name__ == "__main__":
@@ -1,26 +1,37 @@
 """Tests for file utilities."""
 
+import os
 from pathlib import Path
 
+import pytest
+
 from renderkit.io.file_utils import FileUtils
 
 
 class TestFileUtils:
     """Tests for FileUtils."""
 
-    def test_get_file_extension(self) -> None:
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [("test.exr", "exr"), ("test.PNG", "png"), ("test.file.jpg", "jpg")],
+    )
+    def test_get_file_extension(self, name: str, expected: str) -> None:
         """Test getting file extension."""
-        assert FileUtils.get_file_extension(Path("test.exr")) == "exr"
-        assert FileUtils.get_file_extension(Path("test.PNG")) == "png"
-        assert FileUtils.get_file_extension(Path("test.file.jpg")) == "jpg"
-
-    def test_is_image_file(self) -> None:
+        assert FileUtils.get_file_extension(Path(name)) == expected
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("test.exr", True),
+            ("test.png", True),
+            ("test.jpg", True),
+            ("test.jpeg", True),
+            ("test.txt", False),
+        ],
+    )
+    def test_is_image_file(self, name: str, expected: bool) -> None:
         """Test image file detection."""
-        assert FileUtils.is_image_file(Path("test.exr")) is True
-        assert FileUtils.is_image_file(Path("test.png")) is True
-        assert FileUtils.is_image_file(Path("test.jpg")) is True
-        assert FileUtils.is_image_file(Path("test.jpeg")) is True
-        assert FileUtils.is_image_file(Path("test.txt")) is False
+        assert FileUtils.is_image_file(Path(name)) is expected
 
     def test_ensure_directory(self, tmp_path: Path) -> None:
         """Test directory creation."""
@@ -33,10 +44,11 @@ class TestFileUtils:
     def test_get_file_size(self, tmp_path: Path) -> None:
         """Test getting file size."""
         test_file = tmp_path / "test.txt"
-        test_file.write_text("test content")
+        fd = os.open(test_file, os.O_CREAT | os.O_WRONLY, 0o644)
+        os.ftruncate(fd, 12)
+        os.close(fd)
 
-        size = FileUtils.get_file_size(test_file)
-        assert size > 0
+        assert FileUtils.get_file_size(test_file) == 12
 
         # Non-existent file
         non_existent = tmp_path / "nonexistent.txt"
@@ -1,14 +1,13 @@
 """Integration tests using real EXR sequence files."""
 
 import os
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from renderkit.api.processor import RenderKit
 from renderkit.core.config import ConversionConfigBuilder
-from renderkit.core.sequence import SequenceDetector
+from renderkit.core.sequence import FrameSequence, SequenceDetector
 from renderkit.processing.color_space import ColorSpacePreset
 
 REAL_SEQUENCE_PATTERN = (
@@ -21,7 +20,7 @@ REAL_SEQUENCE_ROOT = Path(
 REQUIRE_REAL_ASSETS = os.getenv("RENDERKIT_REAL_ASSETS") == "1"
 
 pytestmark = pytest.mark.skipif(
-    not (REQUIRE_REAL_ASSETS and REAL_SEQUENCE_ROOT.exists()),
+    not (REQUIRE_REAL_ASSETS and REAL_SEQUENCE_ROOT.is_dir()),
     reason=(
         "Real EXR assets not available. Set RENDERKIT_REAL_ASSETS=1 and ensure "
         "the local path exists to run these tests."
@@ -29,62 +28,95 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(scope="session")
+def real_sequence() -> FrameSequence:
+    """The real sequence, detected once per session."""
+    return SequenceDetector.detect_sequence(REAL_SEQUENCE_PATTERN)
+
+
+@pytest.fixture(scope="session")
+def sequence_file_names(real_sequence: FrameSequence) -> set[str]:
+    """Names of the files next to the real sequence, from one directory scan."""
+    with os.scandir(real_sequence.base_path) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
+@pytest.fixture(scope="session")
+def real_first_frame_path(real_sequence: FrameSequence) -> Path:
+    """Path of the first frame of the real sequence."""
+    return real_sequence.get_file_path(real_sequence.frame_numbers[0])
+
+
+@pytest.fixture(scope="session")
+def real_reader(real_first_frame_path: Path):
+    """Reader backed by the shared ImageCache, so metadata and tiles stay warm."""
+    from renderkit.io.image_reader import ImageReaderFactory
+    from renderkit.io.oiio_cache import get_shared_image_cache
+
+    return ImageReaderFactory.create_reader(
+        real_first_frame_path, image_cache=get_shared_image_cache()
+    )
+
+
+@pytest.fixture(scope="session")
+def real_first_frame_buf(real_reader, real_first_frame_path: Path):
+    """First frame decoded once; tests must not modify it in place."""
+    return real_reader.read_imagebuf(real_first_frame_path)
+
+
 class TestRealEXRSequence:
     """Integration tests with real EXR sequence files."""
 
-    def test_sequence_detection_real_files(self) -> None:
+    def test_sequence_detection_real_files(
+        self, real_sequence: FrameSequence, sequence_file_names: set[str]
+    ) -> None:
         """Test sequence detection with real EXR files."""
-        sequence = SequenceDetector.detect_sequence(REAL_SEQUENCE_PATTERN)
-
         # Verify sequence was detected
-        assert sequence is not None
-        assert len(sequence) > 0
-        assert len(sequence.frame_numbers) > 0
+        assert real_sequence is not None
+        assert len(real_sequence) > 0
+        assert len(real_sequence.frame_numbers) > 0
 
         # Verify first frame exists
-        first_frame = sequence.get_file_path(sequence.frame_numbers[0])
-        assert first_frame.exists(), f"First frame should exist: {first_frame}"
+        first_frame = real_sequence.get_file_path(real_sequence.frame_numbers[0])
+        assert first_frame.name in sequence_file_names, f"First frame should exist: {first_frame}"
 
         # Verify padding
-        assert sequence.padding == 4
+        assert real_sequence.padding == 4
 
-    def test_sequence_frame_numbers(self) -> None:
+    def test_sequence_frame_numbers(self, real_sequence: FrameSequence) -> None:
         """Test that frame numbers are correctly detected."""
-        sequence = SequenceDetector.detect_sequence(REAL_SEQUENCE_PATTERN)
-
         # Verify frame numbers are sorted
-        assert sequence.frame_numbers == sorted(sequence.frame_numbers)
+        assert real_sequence.frame_numbers == sorted(real_sequence.frame_numbers)
 
         # Verify frame numbers are positive
-        assert all(f > 0 for f in sequence.frame_numbers)
+        assert all(f > 0 for f in real_sequence.frame_numbers)
 
-    def test_get_file_paths(self) -> None:
+    def test_get_file_paths(
+        self, real_sequence: FrameSequence, sequence_file_names: set[str]
+    ) -> None:
         """Test getting file paths for specific frames."""
-        sequence = SequenceDetector.detect_sequence(REAL_SEQUENCE_PATTERN)
-
         # Test getting path for first frame
-        first_frame_num = sequence.frame_numbers[0]
-        first_path = sequence.get_file_path(first_frame_num)
-        assert first_path.exists(), f"Frame {first_frame_num} should exist: {first_path}"
+        first_frame_num = real_sequence.frame_numbers[0]
+        first_path = real_sequence.get_file_path(first_frame_num)
+        assert first_path.name in sequence_file_names, (
+            f"Frame {first_frame_num} should exist: {first_path}"
+        )
 
         # Test getting path for middle frame (if available)
-        if len(sequence.frame_numbers) > 2:
-            middle_frame_num = sequence.frame_numbers[len(sequence.frame_numbers) // 2]
-            middle_path = sequence.get_file_path(middle_frame_num)
-            assert middle_path.exists(), f"Frame {middle_frame_num} should exist: {middle_path}"
+        if len(real_sequence.frame_numbers) > 2:
+            middle_frame_num = real_sequence.frame_numbers[len(real_sequence.frame_numbers) // 2]
+            middle_path = real_sequence.get_file_path(middle_frame_num)
+            assert middle_path.name in sequence_file_names, (
+                f"Frame {middle_frame_num} should exist: {middle_path}"
+            )
 
-    def test_image_reader_real_files(self) -> None:
+    def test_image_reader_real_files(
+        self, real_reader, real_first_frame_path: Path, real_first_frame_buf
+    ) -> None:
         """Test reading real EXR files."""
         import OpenImageIO as oiio
 
-        from renderkit.io.image_reader import ImageReaderFactory
-
-        sequence = SequenceDetector.detect_sequence(REAL_SEQUENCE_PATTERN)
-        first_frame_path = sequence.get_file_path(sequence.frame_numbers[0])
-
-        # Create reader and read image
-        reader = ImageReaderFactory.create_reader(first_frame_path)
-        buf = reader.read_imagebuf(first_frame_path)
+        buf = real_first_frame_buf
         image = buf.get_pixels(oiio.FLOAT)
         assert image is not None and image.size > 0
 
@@ -97,29 +129,21 @@ class TestRealEXRSequence:
         assert image.shape[2] in [3, 4]
 
         # Verify resolution
-        width, height = reader.get_resolution(first_frame_path)
+        width, height = real_reader.get_resolution(real_first_frame_path)
         assert width > 0
         assert height > 0
         assert image.shape[0] == height
         assert image.shape[1] == width
 
-    def test_color_space_conversion_real_files(self) -> None:
+    def test_color_space_conversion_real_files(self, real_first_frame_buf) -> None:
         """Test color space conversion with real EXR files."""
         import OpenImageIO as oiio
 
-        from renderkit.io.image_reader import ImageReaderFactory
         from renderkit.processing.color_space import ColorSpaceConverter
 
-        sequence = SequenceDetector.detect_sequence(REAL_SEQUENCE_PATTERN)
-        first_frame_path = sequence.get_file_path(sequence.frame_numbers[0])
-
-        # Read image
-        reader = ImageReaderFactory.create_reader(first_frame_path)
-        buf = reader.read_imagebuf(first_frame_path)
-
         # Convert color space
         converter = ColorSpaceConverter(ColorSpacePreset.LINEAR_TO_SRGB)
-        converted_buf = converter.convert_buf(buf)
+        converted_buf = converter.convert_buf(real_first_frame_buf)
         converted = converted_buf.get_pixels(oiio.FLOAT)
         if converted is not None and converted.ndim == 1:
             spec = converted_buf.spec()
@@ -131,94 +155,94 @@ class TestRealEXRSequence:
         assert converted.min() >= 0.0
         assert converted.max() <= 1.0
 
-    def test_full_conversion_small_range(self) -> None:
+    def test_full_conversion_small_range(
+        self, real_sequence: FrameSequence, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
         """Test full conversion with a small frame range."""
-        sequence = SequenceDetector.detect_sequence(self.REAL_SEQUENCE_PATTERN)
-
         # Use only first 3 frames for quick test
-        if len(sequence.frame_numbers) < 3:
+        if len(real_sequence.frame_numbers) < 3:
             pytest.skip("Not enough frames in sequence")
 
-        start_frame = sequence.frame_numbers[0]
-        end_frame = sequence.frame_numbers[min(2, len(sequence.frame_numbers) - 1)]
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test_output.mp4"
-
-            # Build configuration
-            config = (
-                ConversionConfigBuilder()
-                .with_input_pattern(REAL_SEQUENCE_PATTERN)
-                .with_output_path(str(output_path))
-                .with_fps(24.0)
-                .with_frame_range(start_frame, end_frame)
-                .with_color_space_preset(ColorSpacePreset.LINEAR_TO_SRGB)
-                .build()
-            )
-
-            # Convert
-            processor = RenderKit()
-            processor.convert_with_config(config)
-
-            # Verify output file was created
-            assert output_path.exists(), "Output video file should be created"
-            assert output_path.stat().st_size > 0, "Output file should not be empty"
-
-    def test_full_conversion_all_frames(self) -> None:
+        start_frame = real_sequence.frame_numbers[0]
+        end_frame = real_sequence.frame_numbers[min(2, len(real_sequence.frame_numbers) - 1)]
+
+        output_path = tmp_path_factory.mktemp("conv") / "test_output.mp4"
+
+        # Build configuration
+        config = (
+            ConversionConfigBuilder()
+            .with_input_pattern(REAL_SEQUENCE_PATTERN)
+            .with_output_path(str(output_path))
+            .with_fps(24.0)
+            .with_frame_range(start_frame, end_frame)
+            .with_color_space_preset(ColorSpacePreset.LINEAR_TO_SRGB)
+            .build()
+        )
+
+        # Convert
+        processor = RenderKit()
+        processor.convert_with_config(config)
+
+        # Verify output file was created
+        assert output_path.exists(), "Output video file should be created"
+        assert output_path.stat().st_size > 0, "Output file should not be empty"
+
+    @pytest.mark.slow
+    def test_full_conversion_all_frames(
+        self, real_sequence: FrameSequence, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
         """Test full conversion with all frames (may take longer)."""
-        SequenceDetector.detect_sequence(REAL_SEQUENCE_PATTERN)
+        output_path = tmp_path_factory.mktemp("conv") / "test_output_all_frames.mp4"
+
+        # Build configuration
+        config = (
+            ConversionConfigBuilder()
+            .with_input_pattern(REAL_SEQUENCE_PATTERN)
+            .with_output_path(str(output_path))
+            .with_fps(24.0)
+            .with_color_space_preset(ColorSpacePreset.LINEAR_TO_SRGB)
+            .build()
+        )
+
+        # Convert
+        processor = RenderKit()
+        processor.convert_with_config(config)
+
+        # Verify output file was created
+        assert output_path.exists(), "Output video file should be created"
+        assert output_path.stat().st_size > 0, "Output file should not be empty"
+
+    @pytest.mark.slow
+    def test_conversion_with_different_color_spaces(
+        self, real_sequence: FrameSequence, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        """Test conversion with different color space presets."""
+        # Use only first frame for quick test
+        start_frame = real_sequence.frame_numbers[0]
+        end_frame = start_frame
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test_output_all_frames.mp4"
+        color_spaces = [
+            ColorSpacePreset.LINEAR_TO_SRGB,
+            ColorSpacePreset.LINEAR_TO_REC709,
+            ColorSpacePreset.NO_CONVERSION,
+        ]
+
+        out_dir = tmp_path_factory.mktemp("cs")
+        processor = RenderKit()
+        for color_space in color_spaces:
+            output_path = out_dir / f"test_output_{color_space.name}.mp4"
 
-            # Build configuration
             config = (
                 ConversionConfigBuilder()
                 .with_input_pattern(REAL_SEQUENCE_PATTERN)
                 .with_output_path(str(output_path))
                 .with_fps(24.0)
-                .with_color_space_preset(ColorSpacePreset.LINEAR_TO_SRGB)
+                .with_frame_range(start_frame, end_frame)
+                .with_color_space_preset(color_space)
                 .build()
             )
 
-            # Convert
-            processor = RenderKit()
             processor.convert_with_config(config)
 
-            # Verify output file was created
-            assert output_path.exists(), "Output video file should be created"
-            assert output_path.stat().st_size > 0, "Output file should not be empty"
-
-    def test_conversion_with_different_color_spaces(self) -> None:
-        """Test conversion with different color space presets."""
-        sequence = SequenceDetector.detect_sequence(REAL_SEQUENCE_PATTERN)
-
-        # Use only first frame for quick test
-        start_frame = sequence.frame_numbers[0]
-        end_frame = start_frame
-
-        color_spaces = [
-            ColorSpacePreset.LINEAR_TO_SRGB,
-            ColorSpacePreset.LINEAR_TO_REC709,
-            ColorSpacePreset.NO_CONVERSION,
-        ]
-
-        for color_space in color_spaces:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                output_path = Path(tmpdir) / f"test_output_{color_space.name}.mp4"
-
-                config = (
-                    ConversionConfigBuilder()
-                    .with_input_pattern(REAL_SEQUENCE_PATTERN)
-                    .with_output_path(str(output_path))
-                    .with_fps(24.0)
-                    .with_frame_range(start_frame, end_frame)
-                    .with_color_space_preset(color_space)
-                    .build()
-                )
-
-                processor = RenderKit()
-                processor.convert_with_config(config)
-
-                assert output_path.exists(), f"Output should be created for {color_space.name}"
-                assert output_path.stat().st_size > 0
+            assert output_path.exists(), f"Output should be created for {color_space.name}"
+            assert output_path.stat().st_size > 0
@@ -0,0 +1,322 @@
+"""Tests for the background preview worker."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from renderkit.processing.color_space import ColorSpacePreset
+
+oiio = pytest.importorskip("OpenImageIO")
+
+
+def _write_image(path, width=64, height=32, channels=3, fmt=None, value=0.5):
+    spec = oiio.ImageSpec(width, height, channels, fmt or oiio.FLOAT)
+    buf = oiio.ImageBuf(spec)
+    oiio.ImageBufAlgo.fill(buf, tuple([value] * channels))
+    assert buf.write(str(path))
+    return path
+
+
+def _run_worker(worker):
+    results = {}
+    worker.preview_ready.connect(lambda image: results.setdefault("image", image))
+    worker.error.connect(lambda message: results.setdefault("error", message))
+    worker.run()
+    return results
+
+
+def test_preview_worker_emits_image(qapp, tmp_path):
+    """The worker should emit an image matching the source resolution."""
+    from renderkit.ui.widgets import PreviewWorker
+
+    path = _write_image(tmp_path / "frame.0001.exr")
+    worker = PreviewWorker(path, ColorSpacePreset.NO_CONVERSION)
+
+    results = _run_worker(worker)
+
+    assert "error" not in results
+    image = results["image"]
+    assert (image.width(), image.height()) == (64, 32)
+
+
+def test_preview_worker_reports_missing_file(qapp, tmp_path):
+    """A missing file should be reported through the error signal."""
+    from renderkit.ui.widgets import PreviewWorker
+
+    worker = PreviewWorker(tmp_path / "missing.0001.exr", ColorSpacePreset.NO_CONVERSION)
+
+    results = _run_worker(worker)
+
+    assert "image" not in results
+    assert results["error"]
+
+
+def test_preview_worker_handles_rgba(qapp, tmp_path):
+    """Four-channel images should produce an image with the same dimensions."""
+    from renderkit.ui.widgets import PreviewWorker
+
+    path = _write_image(tmp_path / "frame.0001.exr", width=33, height=17, channels=4)
+    worker = PreviewWorker(path, ColorSpacePreset.NO_CONVERSION)
+
+    results = _run_worker(worker)
+
+    assert "error" not in results
+    image = results["image"]
+    assert (image.width(), image.height()) == (33, 17)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(-0.5, 0), (0.5, 128), (2.0, 255)],
+)
+def test_preview_worker_quantizes_float_pixels(qapp, tmp_path, value, expected):
+    """Float pixels should be clamped to [0, 1] and rounded to 8 bits."""
+    from renderkit.ui.widgets import PreviewWorker
+
+    path = _write_image(tmp_path / "frame.0001.exr", width=4, height=4, value=value)
+    worker = PreviewWorker(path, ColorSpacePreset.NO_CONVERSION)
+
+    results = _run_worker(worker)
+
+    color = results["image"].pixelColor(0, 0)
+    assert (color.red(), color.green(), color.blue()) == (expected,) * 3
+
+
+def test_preview_worker_applies_preview_scale(qapp, tmp_path):
+    """The preview scale should shrink the image before it reaches Qt."""
+    from renderkit.ui.widgets import PreviewWorker
+
+    path = _write_image(tmp_path / "frame.0001.exr")
+    worker = PreviewWorker(path, ColorSpacePreset.NO_CONVERSION, preview_scale=0.5)
+
+    results = _run_worker(worker)
+
+    assert "error" not in results
+    image = results["image"]
+    assert (image.width(), image.height()) == (32, 16)
+
+
+def test_cancelled_preview_worker_emits_nothing(qapp, tmp_path):
+    """A cancelled worker should stop without emitting an image or an error."""
+    from renderkit.ui.widgets import PreviewWorker
+
+    path = _write_image(tmp_path / "frame.0001.exr")
+    worker = PreviewWorker(path, ColorSpacePreset.NO_CONVERSION)
+    worker.cancel()
+
+    results = _run_worker(worker)
+
+    assert worker.is_cancelled()
+    assert results == {}
+
+
+def test_preview_thread_delivers_latest_request(qapp, tmp_path):
+    """Superseded requests should never be the last result delivered."""
+    from renderkit.ui.widgets import PreviewThread, PreviewWorker
+
+    first = _write_image(tmp_path / "first.0001.exr", width=16, height=8)
+    second = _write_image(tmp_path / "second.0001.exr", width=48, height=24)
+    results = []
+    thread = PreviewThread()
+    thread.preview_ready.connect(lambda image, rid: results.append((rid, image.width())))
+    thread.error.connect(lambda message, rid: results.append((rid, message)))
+
+    try:
+        thread.submit(PreviewWorker(first, ColorSpacePreset.NO_CONVERSION), 1)
+        thread.submit(PreviewWorker(second, ColorSpacePreset.NO_CONVERSION), 2)
+        deadline = time.monotonic() + 10
+        while not any(rid == 2 for rid, _ in results) and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+    finally:
+        thread.stop()
+
+    assert results[-1] == (2, 48)
+    assert not thread.isRunning()
+
+
+def test_preview_thread_reuses_cached_image(qapp, tmp_path):
+    """Revisiting an unchanged frame should be served from the preview cache."""
+    from renderkit.ui.widgets import PreviewThread, PreviewWorker
+
+    path = _write_image(tmp_path / "frame.0001.exr")
+    results = []
+    thread = PreviewThread()
+    thread.preview_ready.connect(lambda image, rid: results.append((rid, image)))
+
+    def _render(request_id):
+        job = PreviewWorker(path, ColorSpacePreset.NO_CONVERSION)
+        thread.submit(job, request_id)
+        deadline = time.monotonic() + 10
+        while not any(rid == request_id for rid, _ in results) and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+        return results[-1][1]
+
+    try:
+        first = _render(1)
+        second = _render(2)
+    finally:
+        thread.stop()
+
+    assert first.cacheKey() == second.cacheKey()
+
+
+def test_preview_thread_stop_waits_for_inflight_render(qapp):
+    """stop() must not return while a render that ignores cancel is still running."""
+    from renderkit.ui.widgets import PreviewThread
+
+    started = threading.Event()
+
+    class _SlowJob:
+        def cache_key(self):
+            return None
+
+        def cancel(self):
+            pass
+
+        def is_cancelled(self):
+            return False
+
+        def render(self):
+            started.set()
+            time.sleep(0.3)
+            return None
+
+    thread = PreviewThread()
+    thread.submit(_SlowJob(), 1)
+    assert started.wait(5)
+
+    thread.stop()
+
+    assert not thread.isRunning()
+
+
+@pytest.mark.parametrize(
+    ("channels", "fmt"),
+    [(1, None), (3, "uint8")],
+    ids=["grayscale", "uint8-rgb"],
+)
+def test_preview_worker_native_formats(qapp, tmp_path, channels, fmt):
+    """Single-channel and 8-bit sources should map onto a QImage directly."""
+    from renderkit.ui.widgets import PreviewWorker
+
+    suffix = "png" if fmt == "uint8" else "exr"
+    path = _write_image(
+        tmp_path / f"frame.0001.{suffix}",
+        width=40,
+        height=20,
+        channels=channels,
+        fmt=getattr(oiio, fmt.upper()) if fmt else None,
+    )
+    worker = PreviewWorker(path, ColorSpacePreset.NO_CONVERSION)
+
+    results = _run_worker(worker)
+
+    assert "error" not in results
+    image = results["image"]
+    assert (image.width(), image.height()) == (40, 20)
+
+
+def test_fit_pixmap_reuses_exact_fit(qapp):
+    """Pixmaps that already fit the target should not be rescaled."""
+    from renderkit.ui.qt_compat import QPixmap, QSize
+    from renderkit.ui.widgets import _fit_pixmap
+
+    pixmap = QPixmap(200, 100)
+
+    assert _fit_pixmap(pixmap, QSize(200, 150)).cacheKey() == pixmap.cacheKey()
+    assert _fit_pixmap(pixmap, QSize(150, 150)).size() == QSize(150, 75)
+    assert _fit_pixmap(pixmap, QSize(50, 50)).size() == QSize(50, 25)
+    assert _fit_pixmap(pixmap, QSize(400, 400)).size() == QSize(400, 200)
+
+
+def test_fit_pixmap_smooths_mild_downscales_unless_asked(qapp):
+    """Mild downscales are only nearest-neighbour when fast_mild_downscale is set."""
+    from renderkit.ui.qt_compat import QImage, QPixmap, QSize, Qt
+    from renderkit.ui.widgets import _fit_pixmap
+
+    yy, xx = np.indices((120, 120))
+    checker = np.where((xx + yy) % 2, 0xFFFFFFFF, 0xFF000000).astype(np.uint32)
+    image = QImage(checker.tobytes(), 120, 120, 120 * 4, QImage.Format.Format_RGB32)
+    pixmap = QPixmap.fromImage(image.copy())
+    target = QSize(100, 100)  # ratio 1.2, below _FAST_SCALE_RATIO
+
+    def scaled(mode):
+        return pixmap.scaled(target, Qt.AspectRatioMode.KeepAspectRatio, mode).toImage()
+
+    smooth = scaled(Qt.TransformationMode.SmoothTransformation)
+    nearest = scaled(Qt.TransformationMode.FastTransformation)
+    assert smooth != nearest
+
+    assert _fit_pixmap(pixmap, target).toImage() == smooth
+    assert _fit_pixmap(pixmap, target, fast_mild_downscale=True).toImage() == nearest
+
+
+def test_preview_worker_uses_preview_filter(qapp, tmp_path, monkeypatch):
+    """Preview downscales should use the worker's (cheap) resize filter."""
+    from renderkit.processing.scaler import ImageScaler
+    from renderkit.ui.widgets import PreviewWorker
+
+    filters = []
+    scale_buf = ImageScaler.scale_buf
+
+    def _record_filter(buf, width, height, filter_name="lanczos3"):
+        filters.append(filter_name)
+        return scale_buf(buf, width, height, filter_name=filter_name)
+
+    monkeypatch.setattr(ImageScaler, "scale_buf", staticmethod(_record_filter))
+    path = _write_image(tmp_path / "frame.0001.exr")
+    worker = PreviewWorker(path, ColorSpacePreset.NO_CONVERSION, preview_scale=0.5)
+
+    results = _run_worker(worker)
+
+    assert "error" not in results
+    assert filters == ["triangle"]
+
+
+def test_preview_worker_reuses_burnin_overlay(qapp, tmp_path, monkeypatch):
+    """Re-rendering a frame with unchanged burn-in metadata should skip text rendering."""
+    from renderkit.core.config import BurnInConfig, BurnInElement
+    from renderkit.processing.burnin import BurnInProcessor
+    from renderkit.ui import widgets
+
+    renders = []
+    render_overlay = BurnInProcessor.render_overlay
+
+    def _record_render(self, *args, **kwargs):
+        renders.append(args)
+        return render_overlay(self, *args, **kwargs)
+
+    monkeypatch.setattr(BurnInProcessor, "render_overlay", _record_render)
+    monkeypatch.setattr(widgets, "_BURNIN_OVERLAYS", widgets.OrderedDict())
+    path = _write_image(tmp_path / "frame.0001.exr")
+    config = BurnInConfig(elements=[BurnInElement(text_template="Frame {frame}")])
+
+    for preset in (ColorSpacePreset.NO_CONVERSION, ColorSpacePreset.LINEAR_TO_SRGB):
+        worker = widgets.PreviewWorker(
+            path, preset, burnin_config=config, burnin_metadata={"frame": 1}
+        )
+        assert "error" not in _run_worker(worker)
+
+    assert len(renders) == 1
+
+
+def test_preview_worker_uses_native_32bit_layout(qapp, tmp_path):
+    """Color previews should arrive in Qt's 32-bit layout with channels in place."""
+    from renderkit.ui.qt_compat import QImage
+    from renderkit.ui.widgets import PreviewWorker
+
+    path = tmp_path / "frame.0001.exr"
+    buf = oiio.ImageBuf(oiio.ImageSpec(4, 4, 3, oiio.FLOAT))
+    oiio.ImageBufAlgo.fill(buf, (1.0, 0.5, 0.0))
+    assert buf.write(str(path))
+
+    results = _run_worker(PreviewWorker(path, ColorSpacePreset.NO_CONVERSION))
+
+    image = results["image"]
+    assert image.format() == QImage.Format.Format_RGB32
+    color = image.pixelColor(0, 0)
+    assert (color.red(), color.green(), color.blue(), color.alpha()) == (255, 128, 0, 255)
@@ -1,5 +1,7 @@
 """Tests for sequence detection and parsing."""
 
+import os
+from collections.abc import Callable, Iterable
 from pathlib import Path
 
 import pytest
@@ -8,57 +10,40 @@ from renderkit.core.sequence import FrameSequence, SequenceDetector
 from renderkit.exceptions import SequenceDetectionError
 
 
-class TestSequenceDetector:
-    """Tests for SequenceDetector."""
-
-    def test_detect_percent_pattern(self, tmp_path: Path) -> None:
-        """Test detection of %04d pattern."""
-        # Create test files
-        for i in range(1, 6):
-            (tmp_path / f"render.{i:04d}.exr").touch()
-
-        pattern = str(tmp_path / "render.%04d.exr")
-        sequence = SequenceDetector.detect_sequence(pattern)
-
-        assert len(sequence) == 5
-        assert sequence.frame_numbers == [1, 2, 3, 4, 5]
-        assert sequence.padding == 4
-
-    def test_detect_dollar_f_pattern(self, tmp_path: Path) -> None:
-        """Test detection of $F4 pattern."""
-        # Create test files
-        for i in range(10, 15):
-            (tmp_path / f"render.{i:04d}.exr").touch()
-
-        pattern = str(tmp_path / "render.$F4.exr")
-        sequence = SequenceDetector.detect_sequence(pattern)
-
-        assert len(sequence) == 5
-        assert sequence.frame_numbers == [10, 11, 12, 13, 14]
+@pytest.fixture
+def make_frames(tmp_path: Path) -> Callable[[str, Iterable[int]], None]:
+    """Create empty frame files named ``fmt % n`` in ``tmp_path``."""
 
-    def test_detect_hash_pattern(self, tmp_path: Path) -> None:
-        """Test detection of #### pattern."""
-        # Create test files
-        for i in range(100, 105):
-            (tmp_path / f"render.{i:04d}.exr").touch()
+    def _make(fmt: str, numbers: Iterable[int]) -> None:
+        prefix = os.fspath(tmp_path) + os.sep
+        for number in numbers:
+            os.close(os.open(prefix + fmt % number, os.O_CREAT | os.O_WRONLY, 0o644))
 
-        pattern = str(tmp_path / "render.####.exr")
-        sequence = SequenceDetector.detect_sequence(pattern)
-
-        assert len(sequence) == 5
-        assert sequence.frame_numbers == [100, 101, 102, 103, 104]
+    return _make
 
-    def test_detect_numeric_pattern(self, tmp_path: Path) -> None:
-        """Test detection of numeric pattern."""
-        # Create test files
-        for i in range(1, 6):
-            (tmp_path / f"render.{i:04d}.exr").touch()
 
-        pattern = str(tmp_path / "render.0001.exr")
-        sequence = SequenceDetector.detect_sequence(pattern)
+class TestSequenceDetector:
+    """Tests for SequenceDetector."""
 
-        assert len(sequence) == 5
-        assert sequence.frame_numbers == [1, 2, 3, 4, 5]
+    @pytest.mark.parametrize(
+        ("pattern", "frames"),
+        [
+            ("render.%04d.exr", range(1, 6)),
+            ("render.$F4.exr", range(10, 15)),
+            ("render.####.exr", range(100, 105)),
+            ("render.0001.exr", range(1, 6)),
+        ],
+        ids=["percent", "dollar_f", "hash", "numeric"],
+    )
+    def test_detect_pattern(self, tmp_path: Path, make_frames, pattern: str, frames: range) -> None:
+        """Test detection of %04d, $F4, #### and numeric patterns."""
+        make_frames("render.%04d.exr", frames)
+
+        sequence = SequenceDetector.detect_sequence(str(tmp_path / pattern))
+
+        assert len(sequence) == len(frames)
+        assert sequence.frame_numbers == list(frames)
+        assert sequence.padding == 4
 
     def test_detect_sequence_not_found(self, tmp_path: Path) -> None:
         """Test error when sequence cannot be detected."""
@@ -67,11 +52,9 @@ class TestSequenceDetector:
         with pytest.raises(SequenceDetectionError):
             SequenceDetector.detect_sequence(pattern)
 
-    def test_get_file_path(self, tmp_path: Path) -> None:
+    def test_get_file_path(self, tmp_path: Path, make_frames) -> None:
         """Test getting file path for a frame number."""
-        # Create test files
-        for i in range(1, 6):
-            (tmp_path / f"render.{i:04d}.exr").touch()
+        make_frames("render.%04d.exr", range(1, 6))
 
         pattern = str(tmp_path / "render.%04d.exr")
         sequence = SequenceDetector.detect_sequence(pattern)
@@ -3,30 +3,7 @@
 from pathlib import Path
 
 from renderkit.ui import main_window_logic
-
-
-class _DummySignal:
-    def __init__(self) -> None:
-        self.connected = []
-
-    def connect(self, func) -> None:
-        self.connected.append(func)
-
-
-class _DummyWorker:
-    def __init__(self, file_path: Path, parent=None) -> None:
-        self.file_path = file_path
-        self.parent = parent
-        self.file_info_ready = _DummySignal()
-        self.error_occurred = _DummySignal()
-        self.started = False
-        self._running = False
-
-    def isRunning(self) -> bool:
-        return self._running
-
-    def start(self) -> None:
-        self.started = True
+from tests._ui_doubles import DummyWorker
 
 
 class _DummyWindow(main_window_logic.MainWindowLogicMixin):
@@ -52,7 +29,7 @@ class _DummyWindow(main_window_logic.MainWindowLogicMixin):
 
 def test_start_file_info_discovery_wires_worker(monkeypatch, tmp_path: Path) -> None:
     """Ensure FileInfoWorker is created and signals are wired with context."""
-    monkeypatch.setattr(main_window_logic, "FileInfoWorker", _DummyWorker)
+    monkeypatch.setattr(main_window_logic, "FileInfoWorker", DummyWorker)
     window = _DummyWindow()
 
     sample_path = tmp_path / "render.0001.exr"
@@ -63,7 +40,7 @@ def test_start_file_info_discovery_wires_worker(monkeypatch, tmp_path: Path) ->
     window._start_file_info_discovery(sample_path, sequence, len(sequence), frame_range, pattern)
 
     worker = window._file_info_worker
-    assert isinstance(worker, _DummyWorker)
+    assert isinstance(worker, DummyWorker)
     assert worker.file_path == sample_path
     assert worker.parent is window
     assert worker.started is True
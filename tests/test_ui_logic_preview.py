@@ -4,59 +4,28 @@ from pathlib import Path
 
 from renderkit.processing.color_space import ColorSpacePreset
 from renderkit.ui import main_window_logic
-
-
-class _DummyValue:
-    def __init__(self, value) -> None:
-        self._value = value
-
-    def value(self):
-        return self._value
-
-
-class _DummyCheck:
-    def __init__(self, checked: bool) -> None:
-        self._checked = checked
-
-    def isChecked(self) -> bool:
-        return self._checked
-
-
-class _DummyCombo:
-    def __init__(self, text: str) -> None:
-        self._text = text
-
-    def currentText(self) -> str:
-        return self._text
-
-
-class _DummyPreviewWidget:
-    def __init__(self) -> None:
-        self.calls = []
-
-    def load_preview(self, *args, **kwargs) -> None:
-        self.calls.append((args, kwargs))
+from tests._ui_doubles import DummyCheck, DummyCombo, DummyPreviewWidget, DummyValue
 
 
 class _DummyWindow(main_window_logic.MainWindowLogicMixin):
     def __init__(self, cs_enabled: bool, burnin_enabled: bool = False) -> None:
-        self.preview_widget = _DummyPreviewWidget()
-        self.preview_scale_spin = _DummyValue(100)
-        self.keep_resolution_check = _DummyCheck(True)
-        self.width_spin = _DummyValue(1920)
-        self.height_spin = _DummyValue(1080)
-        self.cs_enable_check = _DummyCheck(cs_enabled)
-        self.cs_columns_spin = _DummyValue(4)
-        self.cs_padding_spin = _DummyValue(4)
-        self.layer_combo = _DummyCombo("RGBA")
-        self.color_space_combo = _DummyCombo("Linear")
-        self.fps_spin = _DummyValue(24)
-        self.burnin_enable_check = _DummyCheck(burnin_enabled)
-        self.burnin_frame_check = _DummyCheck(True)
-        self.burnin_layer_check = _DummyCheck(True)
-        self.burnin_fps_check = _DummyCheck(True)
-        self.burnin_font_size_spin = _DummyValue(20)
-        self.burnin_opacity_spin = _DummyValue(30)
+        self.preview_widget = DummyPreviewWidget()
+        self.preview_scale_spin = DummyValue(100)
+        self.keep_resolution_check = DummyCheck(True)
+        self.width_spin = DummyValue(1920)
+        self.height_spin = DummyValue(1080)
+        self.cs_enable_check = DummyCheck(cs_enabled)
+        self.cs_columns_spin = DummyValue(4)
+        self.cs_padding_spin = DummyValue(4)
+        self.layer_combo = DummyCombo("RGBA")
+        self.color_space_combo = DummyCombo("Linear")
+        self.fps_spin = DummyValue(24)
+        self.burnin_enable_check = DummyCheck(burnin_enabled)
+        self.burnin_frame_check = DummyCheck(True)
+        self.burnin_layer_check = DummyCheck(True)
+        self.burnin_fps_check = DummyCheck(True)
+        self.burnin_font_size_spin = DummyValue(20)
+        self.burnin_opacity_spin = DummyValue(30)
         self._ocio_role_display_map = {}
         self._last_preview_path = None
 
@@ -1,26 +1,9 @@
 """Tests for the UI toggles in ModernMainWindow."""
 
-import pytest
 
-from renderkit.ui.qt_compat import QApplication
-
-
-@pytest.fixture(scope="session")
-def qapp():
-    """Create QApplication for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-    app.quit()
-
-
-def test_burnin_toggle(qtbot, qapp):
+def test_burnin_toggle(main_window):
     """Test that burn-in toggle correctly enables/disables child widgets."""
-    from renderkit.ui.main_window import ModernMainWindow
-
-    window = ModernMainWindow()
-    qtbot.addWidget(window)
+    window = main_window
 
     # Initially disabled (as per settings/default)
     window.burnin_enable_check.setChecked(False)
@@ -43,12 +26,9 @@ def test_burnin_toggle(qtbot, qapp):
     assert window.burnin_frame_check.isEnabled() is False
 
 
-def test_contact_sheet_toggle_sync(qtbot, qapp):
+def test_contact_sheet_toggle_sync(main_window):
     """Test that contact sheet toggle correctly enables/disables related settings."""
-    from renderkit.ui.main_window import ModernMainWindow
-
-    window = ModernMainWindow()
-    qtbot.addWidget(window)
+    window = main_window
 
     # Initially disabled
     window.cs_enable_check.setChecked(False)
@@ -0,0 +1,24 @@
+"""Run the verify_* smoke scripts in-process so they share one interpreter and import set."""
+
+import pytest
+
+pytest.importorskip("OpenImageIO")
+
+from tests import verify_multipart, verify_oiio, verify_refactor  # noqa: E402
+
+
+def test_verify_refactor() -> None:
+    verify_refactor.verify_refactor()
+
+
+def test_verify_oiio() -> None:
+    if verify_oiio._find_sample() is None:
+        pytest.skip("No sample EXR available")
+    verify_oiio.test_oiio()
+
+
+def test_verify_multipart() -> None:
+    path = verify_multipart.sample_path()
+    if path is None:
+        pytest.skip("Multipart sample EXR not available")
+    verify_multipart.verify_multipart(path)
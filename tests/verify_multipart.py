@@ -1,10 +1,12 @@
 import sys
 from pathlib import Path
+from typing import Optional
 
-# Add src to path
-sys.path.append(str(Path("g:/Projects/Dev/Github/image_video_processor/src")))
-
-from renderkit.io.image_reader import OIIOReader
+# Add src and the repo root (for the shared tests helpers) to path
+_ROOT = Path(__file__).parents[1]
+for _path in (str(_ROOT / "src"), str(_ROOT)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 try:
     import OpenImageIO as oiio
@@ -12,12 +14,29 @@ except ImportError:
     print("OpenImageIO not available")
     sys.exit(1)
 
-path = Path(
-    r"G:\Projects\Data_folder\render\Canyon_Run\sq001\sh001\work\fx\render\CanRun_sh001_fx_v063\SH030_karma_all_render\SH030_karma_all_render.1001.exr"
+from tests._verify_data import sample_data_root  # noqa: E402
+
+# Relative to RENDERKIT_TEST_DATA
+SAMPLE_RELPATH = Path(
+    "render/Canyon_Run/sq001/sh001/work/fx/render/CanRun_sh001_fx_v063"
+    "/SH030_karma_all_render/SH030_karma_all_render.1001.exr"
 )
-reader = OIIOReader()
 
-try:
+
+def sample_path() -> Optional[Path]:
+    """The multipart sample EXR, or None when the test data is not available."""
+    root = sample_data_root()
+    if root is None:
+        return None
+    path = root / SAMPLE_RELPATH
+    return path if path.exists() else None
+
+
+def verify_multipart(path: Path) -> None:
+    from renderkit.io.image_reader import OIIOReader
+
+    reader = OIIOReader()
+
     layers = reader.get_layers(path)
     print(f"Detected layers via OIIOReader: {layers}")
 
@@ -25,14 +44,32 @@ try:
         # Try reading a layer from a non-zero part (e.g., 'albedo' was part 11)
         target_layer = "albedo" if "albedo" in layers else layers[1]
         print(f"Attempting to read layer: {target_layer}")
-        buf = reader.read_imagebuf(path, layer=target_layer)
-        pixels = buf.get_pixels(oiio.FLOAT)
-        if pixels is not None and pixels.ndim == 1:
-            spec = buf.spec()
-            pixels = pixels.reshape((spec.height, spec.width, spec.nchannels))
-        print(f"Sucessfully read '{target_layer}'! Shape: {pixels.shape}")
-except Exception as e:
-    print(f"Error: {e}")
-    import traceback
-
-    traceback.print_exc()
+        # The layer map is built from the same cached part headers as get_layers, so
+        # read_imagebuf can go straight to the part instead of reopening the file to scan it
+        layer_map = reader.get_layer_map(path)
+        buf = reader.read_imagebuf(path, layer=target_layer, layer_map=layer_map)
+        spec = buf.spec()
+        shape = (spec.height, spec.width, spec.nchannels)
+        # Pull a 16x16 corner to prove the part decodes, without copying the whole layer
+        roi = oiio.ROI(0, min(16, spec.width), 0, min(16, spec.height), 0, 1, 0, spec.nchannels)
+        sample = buf.get_pixels(spec.format, roi)  # HALF stays HALF
+        print(
+            f"Sucessfully read '{target_layer}'! Shape: {shape}, "
+            f"sample: {sample.shape} {sample.dtype}"
+        )
+
+
+if __name__ == "__main__":
+    # Bail out before importing the reader stack when the sample is not on this machine
+    path = sample_path()
+    if path is None:
+        print("Skip: multipart sample not found; set RENDERKIT_TEST_DATA to the data root")
+        sys.exit(0)
+
+    try:
+        verify_multipart(path)
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+
+        traceback.print_exc()
@@ -1,5 +1,11 @@
+import json
+import os
 import sys
+import tempfile
 from pathlib import Path
+from typing import Optional
+
+import numpy as np
 
 try:
     import OpenImageIO as oiio
@@ -9,53 +15,104 @@ except ImportError:
     print("OIIO not found")
     sys.exit(1)
 
-# Add src to path
-sys.path.append(str(Path("g:/Projects/Dev/Github/image_video_processor/src")))
-
-from renderkit.io.image_reader import ImageReaderFactory
-from renderkit.processing.scaler import ImageScaler
+# Add src and the repo root (for the shared tests helpers) to path
+_ROOT = Path(__file__).parents[1]
+for _path in (str(_ROOT / "src"), str(_ROOT)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from renderkit.io.image_reader import ImageReaderFactory  # noqa: E402
+from renderkit.io.oiio_cache import get_shared_image_cache  # noqa: E402
+from renderkit.processing.scaler import ImageScaler  # noqa: E402
+from tests._verify_data import sample_data_root  # noqa: E402
+
+
+def _as_hwc(pixels, spec):
+    """Reshape flat OIIO pixels to (H, W, C) in place; copy only if they are not contiguous."""
+    if pixels is None or pixels.ndim != 1:
+        return pixels
+    shape = (spec.height, spec.width, spec.nchannels)
+    try:
+        pixels.shape = shape
+    except AttributeError:
+        pixels = np.ascontiguousarray(pixels).reshape(shape)
+    return pixels
+
+
+def _read_spec(path: Path):
+    """Read the image header through the shared ImageCache the reader also uses."""
+    cache = get_shared_image_cache()
+    spec = cache.get_imagespec(str(path))
+    # has_error is sticky across callers of the shared cache, so judge by the spec itself
+    if spec is None or spec.width == 0:
+        raise RuntimeError(cache.geterror())
+    return spec
+
+
+_SAMPLE_CACHE = Path(tempfile.gettempdir()) / "renderkit_verify_sample.json"
+
+
+def _cached_sample(root: Path) -> Optional[Path]:
+    """Return the previous run's sample if it is under ``root``, still there and unchanged."""
+    try:
+        cached = json.loads(_SAMPLE_CACHE.read_text(encoding="utf-8"))
+        path = Path(cached["path"])
+        if path.is_relative_to(root) and path.stat().st_mtime == cached["mtime"]:
+            return path
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _find_sample() -> Optional[Path]:
+    """Locate a sample EXR, reusing the last run's pick to skip the directory walk."""
+    root = sample_data_root()
+    if root is None:
+        return None
+    sample = _cached_sample(root)
+    if sample is not None:
+        return sample
+
+    # Stop at the first match rather than listing the whole data tree
+    sample = next(root.rglob("*.exr"), None)
+    if sample is None:
+        return None
+
+    tmp_path = _SAMPLE_CACHE.with_suffix(".tmp")
+    try:
+        tmp_path.write_text(
+            json.dumps({"path": str(sample), "mtime": sample.stat().st_mtime}), encoding="utf-8"
+        )
+        os.replace(tmp_path, _SAMPLE_CACHE)
+    except OSError:
+        pass
+    return sample
 
 
 def test_oiio():
-    # Use real sequence from integration tests
-    base_path = Path(
-        "G:/Projects/AYON_PROJECTS/Canyon_Run/sq001/sh001/publish/render/renderCompositingMain/v001"
-    )
-    samples = list(base_path.glob("*.exr"))
-
-    if not samples:
-        # Fallback to current dir glob if AYON path doesn't exist on this machine
-        samples = list(Path("g:/Projects/Dev/Github/image_video_processor").glob("**/*.exr"))
-
-    if not samples:
-        print("No sample EXR found for testing.")
+    sample_path = _find_sample()
+    if sample_path is None:
+        print("No sample EXR found; set RENDERKIT_TEST_DATA to the data root.")
         return
 
-    sample_path = samples[0]
     print(f"Testing with: {sample_path}")
 
     # Test Reader
     reader = ImageReaderFactory.create_reader(sample_path)
     print(f"Using reader: {type(reader).__name__}")
 
-    buf = reader.read_imagebuf(sample_path)
-    pixels = buf.get_pixels(oiio.FLOAT)
-    if pixels is not None and pixels.ndim == 1:
-        spec = buf.spec()
-        pixels = pixels.reshape((spec.height, spec.width, spec.nchannels))
-    print(f"Image shape: {pixels.shape}, dtype: {pixels.dtype}")
-
-    res = reader.get_resolution(sample_path)
-    print(f"Resolution: {res}")
-
-    fps = reader.get_metadata_fps(sample_path)
-    print(f"Metadata FPS: {fps}")
+    # Shape and format come from the header; pixels are only decoded for the scaler
+    spec = _read_spec(sample_path)
+    print(f"Image shape: {(spec.height, spec.width, spec.nchannels)}, dtype: {spec.format}")
 
-    colorspace = reader.get_metadata_color_space(sample_path)
-    print(f"Metadata ColorSpace: {colorspace}")
+    # One FileInfo carries resolution, metadata and layers from a single header pass
+    file_info = reader.get_file_info(sample_path)
+    print(f"Resolution: {(file_info.width, file_info.height)}")
+    print(f"Metadata FPS: {file_info.fps}")
+    print(f"Metadata ColorSpace: {file_info.color_space}")
 
     # Test Layers
-    layers = reader.get_layers(sample_path)
+    layers = file_info.layers
     print(f"Available layers: {layers}")
 
     if len(layers) > 1:
@@ -63,19 +120,19 @@ def test_oiio():
         layer_to_read = layers[1]
         print(f"Attempting to read layer: {layer_to_read}")
         layer_buf = reader.read_imagebuf(sample_path, layer=layer_to_read)
-        layer_pixels = layer_buf.get_pixels(oiio.FLOAT)
-        if layer_pixels is not None and layer_pixels.ndim == 1:
-            spec = layer_buf.spec()
-            layer_pixels = layer_pixels.reshape((spec.height, spec.width, spec.nchannels))
-        print(f"Layer image shape: {layer_pixels.shape}")
+        layer_spec = layer_buf.spec()
+        # Native format keeps half-float layers as float16 instead of widening them
+        layer_pixels = _as_hwc(layer_buf.get_pixels(layer_spec.format), layer_spec)
+        print(f"Layer image shape: {layer_pixels.shape}, dtype: {layer_pixels.dtype}")
 
     # Test Scaler
+    buf = reader.read_imagebuf(sample_path)
     scaled_buf = ImageScaler.scale_buf(buf, width=100, height=100)
-    scaled_pixels = scaled_buf.get_pixels(oiio.FLOAT)
-    if scaled_pixels is not None and scaled_pixels.ndim == 1:
-        spec = scaled_buf.spec()
-        scaled_pixels = scaled_pixels.reshape((spec.height, spec.width, spec.nchannels))
-    print(f"Scaled shape: {scaled_pixels.shape}")
+    scaled_spec = scaled_buf.spec()
+    print(
+        f"Scaled shape: {(scaled_spec.height, scaled_spec.width, scaled_spec.nchannels)}, "
+        f"dtype: {scaled_spec.format}"
+    )
 
     print("OIIO Verification Successful!")
 